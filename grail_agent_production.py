@@ -22,31 +22,45 @@ STPEP 6 ENHANCEMENTS:
 """
 
 import os
+import re
+import atexit
 import sys
 import json
 import time
+import queue
 import random
+import hashlib
 import logging
-import argparse
+import logging.handlers
+import sqlite3
+import contextlib
+import threading
+import concurrent.futures
+from collections import Counter, OrderedDict, deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from enum import Enum
+from html.parser import HTMLParser
 
+# supabase, playwright and transformers are imported by the init_* methods
+# that use them, so smoke and demo runs don't pay for loading them
 try:
     from dotenv import load_dotenv
-    from supabase import create_client, Client
-    from playwright.sync_api import sync_playwright, Browser, Page
-    from transformers import pipeline
-    from overlord_sentinel import BaselineCollector, RiskSentinel, OverlordReport
+    from overlord_sentinel import BaselineCollector, RiskSentinel, OverlordReport, write_atomic
     from overlord_controller import OverlordController, ExecutionGuard
     from overlord_approver import PlanApprover, ApprovalRegistry
     from overlord_executor import SafeExecutor, ConfigValidator
 except ImportError as e:
     print(f"Missing dependency: {e}")
-    print("Install: pip install python-dotenv supabase playwright transformers torch")
+    print("Install: pip install python-dotenv")
     sys.exit(1)
 
+if TYPE_CHECKING:
+    from supabase import Client
+    from playwright.sync_api import Browser, Page
+
 # STEP 7 modules availability check (import test only)
 try:
     from overlord_verifier import ExecutionVerifier
@@ -56,8 +70,388 @@ try:
 except ImportError:
     STEP7_AVAILABLE = False
 
+# HTTP client for the API and static HTML channels
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# Optional C-accelerated JSON for checkpoints (stdlib json fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 load_dotenv()
 
+# Opt back in to loading every heavy dependency at startup
+if os.getenv('GRAIL_EAGER_IMPORTS') == '1':
+    import supabase  # noqa: F401
+    import playwright.sync_api  # noqa: F401
+    import transformers  # noqa: F401
+
+# Sentiment model and texts per forward pass
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+SENTIMENT_BATCH_SIZE = 16
+
+# Token limit per text; event titles + descriptions fit comfortably
+SENTIMENT_MAX_TOKENS = 128
+
+# Sentiment results kept for recurring texts (least recently used evicted)
+SENTIMENT_CACHE_SIZE = 1024
+
+# Shared read-only result for text with no sentiment signal
+NEUTRAL_SENTIMENT = MappingProxyType({'label': 'NEUTRAL', 'score': 0.5})
+
+# Longest a sentiment call waits for the background model load (seconds)
+ML_WARMUP_TIMEOUT_S = 30.0
+
+# PostgREST request timeout (seconds)
+SUPABASE_HTTP_TIMEOUT_S = 10.0
+
+# Supabase writer queue control markers
+_LOG_FLUSH = object()
+_LOG_STOP = object()
+
+# Rows waiting for the Supabase writer; beyond this, new rows are dropped
+LOG_QUEUE_MAX = 10000
+
+# (connect, read) timeouts for the API and static HTML channels (seconds)
+HTTP_TIMEOUT = (3, 10)
+
+# How long the API probe runs before the browser is warmed up in parallel
+API_GRACE_S = 1.0
+
+# Wall-clock budget for all smoke checks together (they run concurrently)
+SMOKE_CHECK_TIMEOUT_S = 30.0
+
+# Static assets aborted by the scraping browser context
+BLOCKED_ASSETS = "**/*.{png,jpg,jpeg,gif,svg,webp,css,woff,woff2}"
+
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Longest cleanup() waits on Playwright before the process is force-exited
+BROWSER_CLOSE_TIMEOUT_S = 5.0
+
+# Extracts up to 10 event cards in a single browser round-trip. Uses
+# textContent (raw DOM text, no layout pass); values are stripped in Python.
+_EVENT_CARDS_JS = """
+cards => cards.slice(0, 10).map(card => {
+    const text = selector => {
+        const el = card.querySelector(selector);
+        return el ? el.textContent : null;
+    };
+    return {
+        title: text('.event-title'),
+        description: text('.event-description'),
+        odds: text('.event-odds'),
+        deadline: text('.event-deadline')
+    };
+})
+"""
+
+# Most events traded from a single scrape (highest confidence first)
+EVENTS_PER_SCRAPE = 10
+
+# Minimum spacing between prediction iterations, and back-off when a
+# scrape returns nothing (seconds)
+PREDICTION_INTERVAL_S = 2.0
+NO_EVENTS_BACKOFF_S = 60.0
+
+# How long the circuit breaker blocks new trades (seconds)
+CIRCUIT_BREAKER_COOLDOWN_S = 300.0
+
+# Position size as a fraction of the current bankroll, and its hard cap
+POSITION_FRACTION = 0.02
+MAX_POSITION_FRACTION = 0.1
+
+# Confidence multiplier by event pattern (unknown patterns: 1.0)
+PATTERN_CONFIDENCE_MULT = {'NEWSEVENT': 1.2, 'CLASSIC': 1.1, 'VOLEVENT': 0.95}
+
+# Demo event generator vocabulary
+DEMO_PATTERNS = ('CLASSIC', 'NEWSEVENT', 'VOLEVENT')
+DEMO_ASSETS = ('BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'AAPL', 'TSLA')
+
+# Every pattern/asset combination, formatted once; drawing one of these
+# uniformly is the same as drawing pattern and asset independently
+_DEMO_EVENT_BASES = tuple(
+    {
+        'title': f"{pattern}: {asset} Movement",
+        'description': f"Prediction opportunity on {asset}",
+        'pattern': pattern,
+        'asset': asset
+    }
+    for pattern in DEMO_PATTERNS
+    for asset in DEMO_ASSETS
+)
+
+# How long a demo event template (titles, patterns, assets) is reused (seconds)
+DEMO_TEMPLATE_TTL_S = 60.0
+
+# Local SQLite store (.checkpoints/grail.db)
+_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    seq INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    timestamp TEXT,
+    event TEXT,
+    pattern TEXT,
+    confidence REAL,
+    position_size REAL,
+    odds REAL,
+    result TEXT,
+    profit_loss REAL,
+    bankroll REAL,
+    session_id TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    checkpoint_id INTEGER NOT NULL,
+    timestamp TEXT,
+    trades_executed INTEGER,
+    wins INTEGER,
+    losses INTEGER,
+    total_profit REAL,
+    bankroll REAL,
+    initial_bankroll REAL,
+    emergency_stop INTEGER,
+    circuit_breaker_triggered INTEGER,
+    last_trade_seq INTEGER,
+    session_id TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (session_id, checkpoint_id)
+);
+"""
+
+
+def _init_db(db: sqlite3.Connection):
+    """Create the local store, adding columns missing from older files"""
+    db.executescript(_DB_SCHEMA)
+    columns = {row[1] for row in db.execute("PRAGMA table_info(trades)")}
+    if 'session_id' not in columns:
+        db.execute("ALTER TABLE trades ADD COLUMN session_id TEXT NOT NULL DEFAULT ''")
+    # Checkpoints used to be keyed by checkpoint_id alone; rebuild the
+    # table under the per-session key, old rows going to the '' session
+    key = {row[1] for row in db.execute("PRAGMA table_info(checkpoints)") if row[5]}
+    if 'session_id' not in key:
+        old = ", ".join(
+            row[1] for row in db.execute("PRAGMA table_info(checkpoints)")
+            if row[1] != 'session_id'
+        )
+        db.executescript(
+            "BEGIN; ALTER TABLE checkpoints RENAME TO checkpoints_old;" + _DB_SCHEMA
+            + f"INSERT INTO checkpoints ({old}) SELECT {old} FROM checkpoints_old;"
+            "DROP TABLE checkpoints_old; COMMIT;"
+        )
+    # Checkpoint replay reads one session's trades in seq order
+    db.execute("CREATE INDEX IF NOT EXISTS trades_session_seq ON trades (session_id, seq)")
+
+# Session summary banner, rendered with %-formatting in print_summary()
+_SUMMARY_TEMPLATE = """
+╔═══════════════════════════════════════════════════════════════╗
+║              GRAIL AGENT SESSION SUMMARY                      ║
+╠═══════════════════════════════════════════════════════════════╣
+║                                                               ║
+║  Mode: %(mode)-20s                                ║
+║  Trades Executed: %(trades_executed)3d                                      ║
+║  Wins: %(wins)3d  |  Losses: %(losses)3d                               ║
+║  Win Rate: %(win_rate)6.2f%%                                         ║
+║                                                               ║
+║  Initial Bankroll: $%(initial_bankroll)10.2f                       ║
+║  Final Bankroll:   $%(bankroll)10.2f                       ║
+║  Total P/L:        $%(total_profit)+10.2f                       ║
+║  ROI:              %(roi)+6.2f%%                                     ║
+║                                                               ║
+║  Emergency Stop: %(emergency_stop)-5s                                 ║
+║  Circuit Breaker: %(circuit_breaker)-10s                          ║
+║                                                               ║
+╠═══════════════════════════════════════════════════════════════╣
+║              API-FIRST COMPLIANCE METRICS                     ║
+╠═══════════════════════════════════════════════════════════════╣
+║                                                               ║
+║  API-First Score: %(api_score)6.1f%%                                    ║
+║  UI Fallbacks:    %(ui_fallbacks)3d                                        ║
+║  Supabase:        %(supabase_rate)6.1f%% success                           ║
+║                                                               ║
+╠═══════════════════════════════════════════════════════════════╣
+║          STEP 6: OVERLORD SUPREME INTEGRATION                ║
+╠═══════════════════════════════════════════════════════════════╣
+║                                                               ║
+║  ConfigLoader:        ✓ Loaded and active                    ║
+║  PlanApprover:        ✓ Ready for human approval             ║
+║  SafeExecutor:        ✓ Ready for SAFE plan execution       ║
+║  ApprovalRegistry:    ✓ Tracking approved plans              ║
+║  Autonomy Level:      2.5 (Sanctioned Execution)             ║
+║                                                               ║
+║  Configuration Source: config/parameters.json                ║
+║  Approval Status:      No pending approvals                  ║
+║  Applied SAFE Plans:   0 (Ready for execution)               ║
+║                                                               ║
+╚═══════════════════════════════════════════════════════════════╝
+"""
+
+
+# Log records are written by one QueueListener thread per process, shared
+# by every GrailAgent: the first agent starts it, the last cleanup() (or
+# interpreter exit) drains and stops it
+_LOG_QUEUE: queue.Queue = queue.Queue(-1)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_listener_users = 0
+_log_listener_lock = threading.Lock()
+
+
+def _acquire_log_listener(console_level: int):
+    """Start the shared log listener if needed and count one more user"""
+    global _log_listener, _log_listener_users
+    with _log_listener_lock:
+        _log_listener_users += 1
+        if _log_listener is not None:
+            return
+        
+        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        
+        # File records are written in blocks of 64 (or at once on ERROR);
+        # _stop_log_listener() flushes whatever is still buffered
+        file_handler = logging.handlers.MemoryHandler(
+            capacity=64,
+            flushLevel=logging.ERROR,
+            target=logging.FileHandler('grail_agent.log', delay=True)
+        )
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(console_level)
+        # Records already written to stdout directly (e.g. the session summary)
+        console_handler.addFilter(lambda record: not getattr(record, 'file_only', False))
+        
+        formatter = logging.Formatter(log_format)
+        # MemoryHandler only buffers; the target does the formatting
+        file_handler.target.setFormatter(formatter)
+        console_handler.setFormatter(formatter)
+        
+        # Callers only enqueue; the listener thread does the actual writes
+        _log_listener = logging.handlers.QueueListener(
+            _LOG_QUEUE, file_handler, console_handler, respect_handler_level=True
+        )
+        _log_listener.start()
+        
+        # No-op once the root logger has its QueueHandler
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(message)s',
+            handlers=[logging.handlers.QueueHandler(_LOG_QUEUE)]
+        )
+
+
+def _release_log_listener():
+    """Count one user less; the last one stops the shared listener"""
+    global _log_listener_users
+    with _log_listener_lock:
+        _log_listener_users -= 1
+        last = _log_listener_users <= 0
+    if last:
+        _stop_log_listener()
+
+
+def _stop_log_listener():
+    """Drain queued log records and stop the listener thread (idempotent)"""
+    global _log_listener, _log_listener_users
+    with _log_listener_lock:
+        if _log_listener is None:
+            return
+        _log_listener.stop()
+        # Nothing else references the file buffer, so flush it now
+        _log_listener.handlers[0].flush()
+        _log_listener = None
+        _log_listener_users = 0
+
+
+atexit.register(_stop_log_listener)
+
+
+# Last formatted wall-clock second, shared by all timestamp call sites
+_TS_CACHE = [0, '']
+
+
+def _now_iso() -> str:
+    """
+    Local ISO-8601 timestamp at one-second resolution
+    
+    The string is only re-formatted when the second changes.
+    """
+    second = int(time.time())
+    if second != _TS_CACHE[0]:
+        _TS_CACHE[:] = [second, datetime.fromtimestamp(second).isoformat()]
+    return _TS_CACHE[1]
+
+
+def _dump_json(data: Dict, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes (compact unless `indent`), using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Dict:
+    """Parse JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _position_size(bankroll: float) -> float:
+    """Stake for the next trade: POSITION_FRACTION of the bankroll, capped"""
+    return bankroll * min(POSITION_FRACTION, MAX_POSITION_FRACTION)
+
+
+def _simulate_demo_session(
+    confidences: List[float],
+    odds: List[float],
+    draws: List[float],
+    bankroll: float,
+    max_consecutive_losses: int,
+    min_bankroll: float,
+    streak: int = 0
+) -> Tuple[List[float], int, int, float, int, int]:
+    """
+    Roll out a sequence of demo trades in one tight loop
+    
+    Follows run()'s stop semantics: the same position sizing as
+    place_prediction, a halt once the bankroll drops below `min_bankroll`,
+    and after a circuit-breaker trip the next trade is blocked (run()
+    then waits out the cooldown, which takes no time in a rollout).
+    `streak` is the loss streak carried in from earlier trades.
+    
+    Returns (profits, wins, losses, final_bankroll, final_streak,
+    breaker_trips), with one profit/loss entry per trade placed.
+    """
+    profits = []
+    wins = losses = trips = 0
+    cooling_down = False
+    for confidence, event_odds, draw in zip(confidences, odds, draws):
+        if cooling_down:
+            cooling_down = False
+            continue
+        position = _position_size(bankroll)
+        if draw < confidence:
+            profit = position * (event_odds - 1)
+            wins += 1
+            streak = 0
+        else:
+            profit = -position
+            losses += 1
+            streak += 1
+            if streak >= max_consecutive_losses:
+                trips += 1
+                cooling_down = True
+        bankroll += profit
+        profits.append(profit)
+        if bankroll < min_bankroll:
+            break
+    return profits, wins, losses, bankroll, streak, trips
+
 
 class ConfigLoader:
     """
@@ -68,11 +462,26 @@ class ConfigLoader:
     - Validates against ConfigValidator whitelist
     - Provides runtime access to parameters
     - Thread-safe caching
+    
+    Known parameters are also bound as typed attributes (e.g.
+    `confidence_threshold`) on every load, for hot-path reads.
     """
     
+    # Defaults for a fresh config; also the fallback for missing keys
+    DEFAULT_PARAMETERS = {
+        'confidence_threshold': 0.70,
+        'max_predictions': 20,
+        'ttl_short': 1800,
+        'ttl_medium': 3600,
+        'ttl_long': 7200,
+        'api_retry_count': 3,
+        'api_timeout_ms': 10000,
+        'ui_fallback_threshold': 5
+    }
+    
     def __init__(self, config_file: str = "config/parameters.json"):
+        # Read-only: the file (and its directory) is written by SafeExecutor
         self.config_file = Path(config_file)
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger('ConfigLoader')
         self.config = None
         self._load()
@@ -80,32 +489,33 @@ class ConfigLoader:
     def _load(self):
         """Load config from file"""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    self.config = json.load(f)
-                self.logger.info(f"✓ Config loaded: {self.config_file}")
-            else:
-                self._create_default()
+            self.config = _load_json(self.config_file.read_bytes())
+            self.logger.info(f"✓ Config loaded: {self.config_file}")
+        except FileNotFoundError:
+            self._create_default()
         except Exception as e:
             self.logger.error(f"Failed to load config: {e}")
             self._create_default()
+        self._bind_parameters()
+    
+    def _bind_parameters(self):
+        """Expose known parameters as attributes, cast to their default's type"""
+        for name, default in self.DEFAULT_PARAMETERS.items():
+            value = self.get_parameter(name, default)
+            try:
+                value = type(default)(value)
+            except (TypeError, ValueError):
+                self.logger.warning(f"Invalid {name}={value!r}, using {default}")
+                value = default
+            setattr(self, name, value)
     
     def _create_default(self):
         """Create default config if missing"""
         self.config = {
             'version': '1.0.0',
-            'created_at': datetime.now().isoformat(),
+            'created_at': _now_iso(),
             'description': 'Grail Agent system parameters',
-            'parameters': {
-                'confidence_threshold': 0.70,
-                'max_predictions': 20,
-                'ttl_short': 1800,
-                'ttl_medium': 3600,
-                'ttl_long': 7200,
-                'api_retry_count': 3,
-                'api_timeout_ms': 10000,
-                'ui_fallback_threshold': 5
-            },
+            'parameters': dict(self.DEFAULT_PARAMETERS),
             'modifications': []
         }
         self.logger.info("✓ Default config created")
@@ -131,66 +541,171 @@ class ConfigLoader:
 class ExecutionChannel(Enum):
     """Execution channel selection"""
     API = "api"
+    HTTP = "http"
     UI = "ui"
     DEMO = "demo"
 
 
+class _EventCardParser(HTMLParser):
+    """
+    Extract .event-card fields from server-rendered events HTML
+    
+    Open elements are tracked by tag name, so an end tag only closes the
+    element it matches (and anything left open inside it); stray end tags
+    are ignored. <p> and <li> are closed implicitly as in browsers.
+    """
+    
+    FIELDS = {
+        'event-title': 'title',
+        'event-description': 'description',
+        'event-odds': 'odds',
+        'event-deadline': 'deadline'
+    }
+    VOID_TAGS = frozenset({
+        'area', 'base', 'br', 'col', 'embed', 'hr', 'img',
+        'input', 'link', 'meta', 'source', 'track', 'wbr'
+    })
+    # Start tags that implicitly close an open <p>
+    CLOSES_P = frozenset({
+        'address', 'article', 'aside', 'blockquote', 'div', 'dl', 'fieldset',
+        'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr',
+        'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'ul'
+    })
+    
+    def __init__(self, limit: int = 10):
+        super().__init__()
+        self.limit = limit
+        self.cards: List[Dict] = []
+        self._open: List[str] = []
+        self._card = None
+        self._card_depth = 0
+        self._field = None
+        self._field_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self.CLOSES_P and self._open and self._open[-1] == 'p':
+            self._close_to(len(self._open) - 1)
+        elif tag == 'li':
+            # A new item closes the previous one in the same list
+            for depth in range(len(self._open) - 1, -1, -1):
+                if self._open[depth] == 'li':
+                    self._close_to(depth)
+                    break
+                if self._open[depth] in ('ul', 'ol'):
+                    break
+        if tag in self.VOID_TAGS:
+            return
+        
+        depth = len(self._open)
+        self._open.append(tag)
+        classes = (dict(attrs).get('class') or '').split()
+        
+        if self._card is None:
+            if 'event-card' in classes and len(self.cards) < self.limit:
+                self._card = {}
+                self._card_depth = depth
+        elif self._field is None:
+            for cls in classes:
+                if cls in self.FIELDS:
+                    self._field = self.FIELDS[cls]
+                    self._field_depth = depth
+                    self._card[self._field] = []
+                    break
+    
+    def handle_endtag(self, tag):
+        for depth in range(len(self._open) - 1, -1, -1):
+            if self._open[depth] == tag:
+                self._close_to(depth)
+                return
+    
+    def _close_to(self, depth: int):
+        """Close the element at `depth` and every element opened inside it"""
+        while len(self._open) > depth:
+            self._open.pop()
+            closed = len(self._open)
+            if self._field is not None and closed == self._field_depth:
+                self._field = None
+            if self._card is not None and closed == self._card_depth:
+                self.cards.append({k: ''.join(v).strip() for k, v in self._card.items()})
+                self._card = None
+    
+    def handle_data(self, data):
+        if self._field is not None:
+            self._card[self._field].append(data)
+
+
 class APIMetrics:
     """API vs UI usage metrics"""
     
+    # Plain int attributes: every increment is a single attribute update
+    __slots__ = (
+        'total_operations',
+        'api_calls',
+        'ui_fallbacks',
+        'http_fallbacks',
+        'playwright_invocations',
+        'supabase_calls',
+        'supabase_failures',
+        'supabase_dropped',
+        'demo_fallbacks',
+        'sentiment_cache_hits',
+        'sentiment_cache_misses'
+    )
+    
     def __init__(self):
-        self.metrics = {
-            'total_operations': 0,
-            'api_calls': 0,
-            'ui_fallbacks': 0,
-            'playwright_invocations': 0,
-            'supabase_calls': 0,
-            'supabase_failures': 0,
-            'demo_fallbacks': 0
-        }
+        for name in self.__slots__:
+            setattr(self, name, 0)
+    
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Snapshot of all counters"""
+        return {name: getattr(self, name) for name in self.__slots__}
     
     def record_operation(self, operation_type: str):
         """Record operation"""
-        self.metrics['total_operations'] += 1
+        self.total_operations += 1
         if operation_type == 'ui':
-            self.metrics['ui_fallbacks'] += 1
-            self.metrics['playwright_invocations'] += 1
+            self.ui_fallbacks += 1
+            self.playwright_invocations += 1
         elif operation_type == 'api':
-            self.metrics['api_calls'] += 1
+            self.api_calls += 1
+        elif operation_type == 'http':
+            self.http_fallbacks += 1
         elif operation_type == 'demo':
-            self.metrics['demo_fallbacks'] += 1
+            self.demo_fallbacks += 1
     
     def record_supabase(self, success: bool):
         """Record Supabase operation"""
-        self.metrics['supabase_calls'] += 1
+        self.supabase_calls += 1
         if not success:
-            self.metrics['supabase_failures'] += 1
+            self.supabase_failures += 1
+    
+    def record_sentiment_cache(self, hits: int, misses: int):
+        """Record sentiment cache lookups"""
+        self.sentiment_cache_hits += hits
+        self.sentiment_cache_misses += misses
     
     def get_api_first_score(self) -> float:
         """API-first compliance score (%)"""
-        total = self.metrics['total_operations']
-        if total == 0:
+        if self.total_operations == 0:
             return 100.0
-        api = self.metrics['api_calls']
-        return (api / total) * 100.0
+        return (self.api_calls / self.total_operations) * 100.0
     
     def get_summary(self) -> dict:
         """Get metrics summary"""
         return {
-            'total_ops': self.metrics['total_operations'],
+            'total_ops': self.total_operations,
             'api_first_score': self.get_api_first_score(),
-            'ui_fallbacks': self.metrics['ui_fallbacks'],
-            'demo_fallbacks': self.metrics['demo_fallbacks'],
+            'ui_fallbacks': self.ui_fallbacks,
+            'demo_fallbacks': self.demo_fallbacks,
             'supabase_success_rate': self._supabase_success_rate()
         }
     
     def _supabase_success_rate(self) -> float:
         """Supabase success rate (%)"""
-        calls = self.metrics['supabase_calls']
-        if calls == 0:
+        if self.supabase_calls == 0:
             return 100.0
-        failures = self.metrics['supabase_failures']
-        return ((calls - failures) / calls) * 100.0
+        return ((self.supabase_calls - self.supabase_failures) / self.supabase_calls) * 100.0
 
 
 class GrailAgent:
@@ -204,6 +719,14 @@ class GrailAgent:
     - Change plan tracking and reporting
     - Overlord Supreme status reporting
     """
+    
+    # Heuristic sentiment keywords (each distinct keyword counts once)
+    POS_WORDS = frozenset({'profit', 'gain', 'up', 'bullish', 'positive'})
+    NEG_WORDS = frozenset({'loss', 'down', 'bearish', 'negative', 'risk'})
+    # One scan finds both polarities; the sets tell them apart
+    SENTIMENT_WORD_RE = re.compile(
+        r"\b(?:%s)\b" % "|".join(sorted(POS_WORDS | NEG_WORDS)), re.IGNORECASE
+    )
 
     def __init__(
         self,
@@ -217,6 +740,14 @@ class GrailAgent:
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(exist_ok=True)
         
+        # Local trade/checkpoint store; checkpoints record the last trade seq
+        self._db = sqlite3.connect(str(self.checkpoint_dir / 'grail.db'), isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        _init_db(self._db)
+        self._last_checkpoint: Optional[Tuple[int, bytes]] = None
+        
         # Trading state
         self.trades_executed = 0
         self.predictions_logged = 0
@@ -225,10 +756,26 @@ class GrailAgent:
         self.total_profit = 0.0
         self.consecutive_losses = 0
         
+        # Trades and checkpoints are stored per session, so resuming never
+        # picks up another run's trades; trade IDs are
+        # "trade_<session id>_<trade number>"
+        self._set_session(f"{int(time.time())}_{os.urandom(3).hex()}")
+        
+        # Per-agent RNG for demo events and simulated outcomes; set
+        # GRAIL_SEED to replay a demo session exactly
+        seed = os.getenv('GRAIL_SEED')
+        self._rng = random.Random(int(seed) if seed else None)
+        self._demo_template: List[Dict] = []
+        self._demo_template_expires = 0.0
+        
+        # Iteration pacing (monotonic deadline for the next prediction)
+        self._next_slot = 0.0
+        
         # Emergency controls
         self.emergency_stop = False
         self.circuit_breaker_triggered = False
         self.max_consecutive_losses = 3
+        self._cb_until = 0.0
         self.min_bankroll_threshold = bankroll * 0.5
         
         # STEP 6: Config loader
@@ -243,20 +790,71 @@ class GrailAgent:
         # Components
         self.setup_logging()
         self.supabase = self.init_supabase()
+        self.http = self.init_http_session()
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='scrape'
+        )
+        # JSON checkpoint copies and the Overlord session files are written
+        # here, off the trading thread; one worker keeps the writes in order
+        self._ckpt_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='ckpt'
+        )
+        self._trade_buf: List[Dict] = []
+        self._pred_buf: List[Dict] = []
+        self._flush_every = 20
+        self._flush_interval = 5.0
+        self._log_q: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_MAX)
+        self._log_thread: Optional[threading.Thread] = None
+        if self.supabase:
+            self._start_log_worker()
+        self._pw = None
         self.browser = None
+        self.context = None
         self.page = None
         self.sentiment_analyzer = None
+        self._sentiment_cache: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._inference_ctx = contextlib.nullcontext
+        
+        # Load the sentiment model in the background while the first
+        # scrape runs (smoke runs never need it)
+        self._ml_ready = threading.Event()
+        self._ml_thread: Optional[threading.Thread] = None
+        # Set once a call has waited out ML_WARMUP_TIMEOUT_S; later calls
+        # use the model only if it has finished loading by then
+        self._ml_wait_expired = False
+        if mode != "smoke":
+            self._start_ml_warmup()
         
-        # API metrics
+        # API metrics (+ the view handed to the Overlord controller each iteration)
         self.api_metrics = APIMetrics()
+        self._metrics_view = {
+            'api_first_score': 100.0,
+            'ui_fallbacks': 0,
+            'demo_fallbacks': 0,
+            'supabase_success_rate': 100.0
+        }
+        
+        # Overlord Sentinel + Controller (smoke runs never trade or report)
+        self.baseline_collector = None
+        self.risk_sentinel = None
+        self.overlord_controller = None
+        self.execution_guard = None
+        if mode != "smoke":
+            self._init_overlord_sentinel()
+        
+        # STEP 6: Initialize config and plan systems
+        self._init_overlord_supreme()
         
-        # Overlord Sentinel
+        self.logger.info(f"Grail Agent initialized: mode={mode}, bankroll=${bankroll:.2f}")
+        self.logger.info("✓ Overlord Supreme Integration: ACTIVE")
+    
+    def _init_overlord_sentinel(self):
+        """Initialize baseline collection, risk sentinel and Overlord Controller"""
         self.baseline_collector = BaselineCollector()
         self.risk_sentinel = RiskSentinel(self.baseline_collector)
         
-        # Overlord Controller
-        self.overlord_controller = None
-        self.execution_guard = None
         try:
             self.overlord_controller = OverlordController(
                 baseline=self.baseline_collector,
@@ -266,12 +864,6 @@ class GrailAgent:
             self.logger.info("✓ Overlord Controller: Level 1 Autonomy active")
         except Exception as e:
             self.logger.debug(f"⚠️  Overlord Controller init failed: {e}")
-        
-        # STEP 6: Initialize config and plan systems
-        self._init_overlord_supreme()
-        
-        self.logger.info(f"Grail Agent initialized: mode={mode}, bankroll=${bankroll:.2f}")
-        self.logger.info("✓ Overlord Supreme Integration: ACTIVE")
     
     def _init_overlord_supreme(self):
         """Initialize STEP 6 Overlord Supreme components"""
@@ -319,19 +911,18 @@ class GrailAgent:
             self.logger.warning("⚠️  Continuing with degraded functionality")
     
     def setup_logging(self):
-        """Configure logging"""
-        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        logging.basicConfig(
-            level=logging.INFO,
-            format=log_format,
-            handlers=[
-                logging.FileHandler('grail_agent.log'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        """Configure logging (the listener thread is shared process-wide)"""
+        _acquire_log_listener(logging.WARNING if self.mode == 'live' else logging.INFO)
+        self._holds_log_listener = True
         self.logger = logging.getLogger('GrailAgent')
 
-    def init_supabase(self) -> Optional[Client]:
+    def _release_log_listener(self):
+        """Drop this agent's hold on the shared log listener (idempotent)"""
+        if self._holds_log_listener:
+            self._holds_log_listener = False
+            _release_log_listener()
+
+    def init_supabase(self) -> Optional['Client']:
         """Initialize Supabase client"""
         try:
             url = os.getenv('SUPABASE_URL')
@@ -339,41 +930,260 @@ class GrailAgent:
             if not url or not key:
                 self.logger.warning("Supabase credentials missing. Running without DB.")
                 return None
+            try:
+                from supabase import create_client
+            except ImportError:
+                self.logger.error("supabase not installed (pip install supabase). Running without DB.")
+                return None
             client = create_client(url, key)
+            self._pool_supabase_session(client)
             self.logger.info("✓ Supabase client initialized")
             return client
         except Exception as e:
             self.logger.error(f"Supabase init failed: {e}")
             return None
 
-    def init_playwright(self) -> Tuple[Browser, Page]:
-        """Initialize Playwright"""
+    def _pool_supabase_session(self, client: 'Client'):
+        """
+        Swap PostgREST's httpx session for one with long-lived keep-alive
+        
+        Batched inserts arrive seconds apart; httpx's default 5s keep-alive
+        expiry would otherwise redo the TCP+TLS handshake on most flushes.
+        """
+        try:
+            import httpx
+            session = client.postgrest.session
+            client.postgrest.session = httpx.Client(
+                base_url=session.base_url,
+                headers=session.headers,
+                timeout=SUPABASE_HTTP_TIMEOUT_S,
+                follow_redirects=True,
+                transport=httpx.HTTPTransport(
+                    limits=httpx.Limits(
+                        max_keepalive_connections=20,
+                        max_connections=40,
+                        keepalive_expiry=60
+                    ),
+                    retries=2
+                )
+            )
+            session.close()
+        except Exception as e:
+            self.logger.debug(f"Supabase connection pool not configured: {e}")
+
+    def init_http_session(self) -> Optional['requests.Session']:
+        """
+        Initialize the pooled HTTP session used by the API and static HTML
+        channels (keep-alive, retries on transient gateway errors)
+        """
+        if not REQUESTS_AVAILABLE:
+            self.logger.warning("requests not installed, HTTP channels disabled")
+            return None
+        
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def init_playwright(self) -> Tuple[Optional['Browser'], Optional['Page']]:
+        """
+        Initialize Playwright
+        
+        The driver, browser and context are kept on the agent and reused
+        for every scrape of the session (warm cookies, no relaunch).
+        """
+        try:
+            from playwright.sync_api import sync_playwright
+        except ImportError:
+            self.logger.error("playwright not installed (pip install playwright)")
+            return None, None
+        
         try:
-            playwright = sync_playwright().start()
-            browser = playwright.chromium.launch(headless=True)
-            context = browser.new_context(
+            self._pw = sync_playwright().start()
+            # Don't leave a headless Chromium behind if cleanup() never runs
+            atexit.unregister(self.close_playwright)
+            atexit.register(self.close_playwright)
+            self.browser = self._pw.chromium.launch(headless=True)
+            self.context = self.browser.new_context(
                 viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                user_agent=BROWSER_USER_AGENT
             )
-            page = context.new_page()
+            # Card text is read from the DOM; images, styles and fonts are dead weight
+            self.context.route(BLOCKED_ASSETS, lambda route: route.abort())
+            page = self.context.new_page()
+            page.set_default_timeout(10000)
             self.logger.info("✓ Playwright browser initialized")
-            return browser, page
+            return self.browser, page
         except Exception as e:
             self.logger.error(f"Playwright init failed: {e}")
+            # Don't leave a half-started driver behind for the next attempt
+            self.close_playwright()
             return None, None
 
+    def _ensure_page(self) -> Optional['Page']:
+        """
+        Return a usable page, paying only for what is missing
+        
+        A closed page is replaced from the live context; the browser is
+        relaunched only if its process has gone away.
+        """
+        if self.page and not self.page.is_closed():
+            return self.page
+        self.page = None
+        
+        if self.browser and self.browser.is_connected() and self.context:
+            try:
+                self.page = self.context.new_page()
+                self.page.set_default_timeout(10000)
+                return self.page
+            except Exception as e:
+                self.logger.warning(f"New page failed, relaunching browser: {e}")
+        
+        self.close_playwright()
+        self.browser, self.page = self.init_playwright()
+        return self.page
+
+    def close_playwright(self):
+        """Close the browser context, browser and driver (safe to call twice)"""
+        for resource, close in (
+            (self.context, 'close'),
+            (self.browser, 'close'),
+            (self._pw, 'stop'),
+        ):
+            if resource:
+                try:
+                    getattr(resource, close)()
+                except:
+                    pass
+        self._pw = self.browser = self.context = self.page = None
+
+    def _start_ml_warmup(self):
+        """Start loading the sentiment model on a background thread"""
+        self._ml_thread = threading.Thread(
+            target=self._warm_ml,
+            name='ml-warmup',
+            daemon=True
+        )
+        self._ml_thread.start()
+
+    def _warm_ml(self):
+        """Load the sentiment model and signal readiness (even on failure)"""
+        try:
+            self.init_ml_model()
+        finally:
+            self._ml_ready.set()
+
     def init_ml_model(self):
-        """Initialize ML sentiment analyzer"""
+        """
+        Initialize ML sentiment analyzer
+        
+        Prefers an INT8-quantized ONNX Runtime model (optimum[onnxruntime]);
+        otherwise uses the transformers pipeline, with Linear layers
+        dynamically quantized to INT8 when running on CPU.
+        """
+        try:
+            from transformers import pipeline
+        except ImportError:
+            self.logger.error("transformers not installed (pip install transformers torch)")
+            self.sentiment_analyzer = None
+            return
+        
+        try:
+            self.sentiment_analyzer = self._init_onnx_int8_pipeline()
+            self.logger.info("✓ ML sentiment analyzer loaded (ONNX Runtime INT8)")
+            return
+        except ImportError:
+            self.logger.debug("optimum[onnxruntime] not installed, using FP32 pipeline")
+        except Exception as e:
+            self.logger.warning(f"ONNX INT8 model init failed, using FP32 pipeline: {e}")
+        
         try:
+            try:
+                import torch
+                device = 0 if torch.cuda.is_available() else -1
+                # Cheaper than the pipeline's own no_grad (no view/version tracking)
+                self._inference_ctx = torch.inference_mode
+            except ImportError:
+                device = -1
+            
+            if device == -1:
+                try:
+                    self.sentiment_analyzer = self._init_torch_int8_pipeline()
+                    self.logger.info("✓ ML sentiment analyzer loaded (PyTorch dynamic INT8)")
+                    return
+                except Exception as e:
+                    self.logger.warning(f"INT8 quantization failed, using FP32 pipeline: {e}")
+            
             self.sentiment_analyzer = pipeline(
                 "sentiment-analysis",
-                model="distilbert-base-uncased-finetuned-sst-2-english"
+                model=SENTIMENT_MODEL,
+                device=device,
+                batch_size=SENTIMENT_BATCH_SIZE
             )
             self.logger.info("✓ ML sentiment analyzer loaded")
         except Exception as e:
             self.logger.error(f"ML model init failed: {e}")
             self.sentiment_analyzer = None
 
+    def _init_onnx_int8_pipeline(self):
+        """Export the sentiment model to ONNX and dynamically quantize it to INT8"""
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer, pipeline
+        
+        model_dir = self.checkpoint_dir / "sentiment-int8"
+        
+        # Export + quantization runs once; later starts load the saved model
+        if not (model_dir / "model_quantized.onnx").exists():
+            ort_model = ORTModelForSequenceClassification.from_pretrained(
+                SENTIMENT_MODEL,
+                export=True
+            )
+            quantizer = ORTQuantizer.from_pretrained(ort_model)
+            quantizer.quantize(
+                save_dir=model_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(
+                    is_static=False,
+                    per_channel=False
+                )
+            )
+        
+        tokenizer = AutoTokenizer.from_pretrained(SENTIMENT_MODEL)
+        int8_model = ORTModelForSequenceClassification.from_pretrained(
+            model_dir,
+            file_name="model_quantized.onnx"
+        )
+        return pipeline(
+            "sentiment-analysis",
+            model=int8_model,
+            tokenizer=tokenizer,
+            batch_size=SENTIMENT_BATCH_SIZE
+        )
+
+    def _init_torch_int8_pipeline(self):
+        """Load the sentiment model with Linear layers dynamically quantized to INT8 (CPU)"""
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+        
+        model = AutoModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL)
+        model = torch.ao.quantization.quantize_dynamic(
+            model.eval(),
+            {torch.nn.Linear},
+            dtype=torch.qint8
+        )
+        return pipeline(
+            "sentiment-analysis",
+            model=model,
+            tokenizer=AutoTokenizer.from_pretrained(SENTIMENT_MODEL),
+            device=-1,
+            batch_size=SENTIMENT_BATCH_SIZE
+        )
+
     def scrape_walbi_events(self) -> List[Dict]:
         """Scrape events from Walbi"""
         if self.mode == "demo":
@@ -382,148 +1192,236 @@ class GrailAgent:
         
         self.logger.info("Live mode: attempting event retrieval...")
         
-        # API-first
-        events = self._scrape_via_api()
+        # API-first, probed on a worker thread. If it hasn't answered within
+        # API_GRACE_S, warm the browser here meanwhile (the sync Playwright
+        # API is bound to the thread that started it).
+        api_future = self._io_pool.submit(self._scrape_via_api)
+        try:
+            events = api_future.result(timeout=API_GRACE_S)
+        except concurrent.futures.TimeoutError:
+            self._ensure_page()
+            events = api_future.result()
         if events:
-            self.logger.info(f"✅ Channel: {ExecutionChannel.API.value}")
+            self.logger.info("✅ Channel: %s", ExecutionChannel.API.value)
             return events
         
-        # UI fallback
-        if not self.page:
-            self.browser, self.page = self.init_playwright()
+        walbi_url = os.getenv('WALBI_URL', 'https://walbi.com/events')
+        
+        # Static HTML (no browser needed for server-rendered listings)
+        events = self._scrape_via_http(walbi_url)
+        if events:
+            self.logger.info("✅ Channel: %s", ExecutionChannel.HTTP.value)
+            self.api_metrics.record_operation('http')
+            return events
         
-        if self.page:
+        # UI fallback
+        if self._ensure_page():
+            from playwright.sync_api import Error as PlaywrightError
+            
             try:
-                walbi_url = os.getenv('WALBI_URL', 'https://walbi.com/events')
-                self.page.goto(walbi_url, timeout=30000)
+                self.page.goto(walbi_url, timeout=30000, wait_until="domcontentloaded")
                 self.page.wait_for_selector('.event-card', timeout=10000)
                 
-                events = []
-                event_cards = self.page.query_selector_all('.event-card')
+                # All cards and fields in one CDP round-trip
+                cards = self.page.eval_on_selector_all('.event-card', _EVENT_CARDS_JS)
+                scraped_at = _now_iso()
                 
-                for card in event_cards[:10]:
-                    try:
-                        title = card.query_selector('.event-title').inner_text()
-                        description = card.query_selector('.event-description').inner_text()
-                        odds = card.query_selector('.event-odds').inner_text()
-                        deadline = card.query_selector('.event-deadline').inner_text()
-                        
-                        events.append({
-                            'title': title,
-                            'description': description,
-                            'odds': odds,
-                            'deadline': deadline,
-                            'scraped_at': datetime.now().isoformat(),
-                            'source': 'ui'
-                        })
-                    except Exception as e:
-                        self.logger.warning(f"Failed to parse event: {e}")
+                events = []
+                for card in cards:
+                    if None in card.values():
+                        self.logger.warning(f"Failed to parse event: missing field in {card}")
                         continue
+                    card = {k: v.strip() for k, v in card.items()}
+                    card['scraped_at'] = scraped_at
+                    card['source'] = 'ui'
+                    events.append(card)
                 
                 if events:
-                    self.logger.info(f"✅ Channel: {ExecutionChannel.UI.value}")
+                    self.logger.info("✅ Channel: %s", ExecutionChannel.UI.value)
                     self.api_metrics.record_operation('ui')
                     return events
-            except Exception as e:
+            except PlaywrightError as e:
                 self.logger.error(f"UI scraping failed: {e}")
+                # Only the page is suspect; the next scrape opens a fresh
+                # one in the same browser context
+                try:
+                    self.page.close()
+                except PlaywrightError:
+                    pass
+                self.page = None
         
         # Demo fallback
         self.logger.warning("⚠️  All methods failed, using demo events")
-        self.logger.info(f"✅ Channel: {ExecutionChannel.DEMO.value}")
+        self.logger.info("✅ Channel: %s", ExecutionChannel.DEMO.value)
         self.api_metrics.record_operation('demo')
         return self._generate_demo_events()
     
     def _scrape_via_api(self) -> Optional[List[Dict]]:
         """Try API-first approach"""
         walbi_api_url = os.getenv('WALBI_API_URL')
-        if not walbi_api_url:
+        if not walbi_api_url or not self.http:
             return None
         
         try:
-            import requests
             self.logger.info("🔌 Attempting API-first...")
-            response = requests.get(
+            response = self.http.get(
                 f"{walbi_api_url}/api/events",
-                timeout=10,
+                timeout=HTTP_TIMEOUT,
                 headers={'User-Agent': 'GrailAgent/2.4'}
             )
             
             if response.status_code == 200:
                 events = self._parse_api_events(response.json())
                 if events:
-                    self.logger.info(f"✅ API success: {len(events)} events")
+                    self.logger.info("✅ API success: %d events", len(events))
                     self.api_metrics.record_operation('api')
                     return events
-        except Exception as e:
-            self.logger.debug(f"API attempt failed: {e}")
+        except (requests.RequestException, ValueError, AttributeError) as e:
+            # ValueError: body is not JSON; AttributeError: unexpected shape
+            self.logger.debug("API attempt failed: %s", e)
         
         return None
     
-    def _parse_api_events(self, data: dict) -> List[Dict]:
-        """Parse API events"""
-        events = []
-        for item in data.get('events', []):
-            events.append({
-                'title': item.get('title', 'Unknown'),
-                'description': item.get('description', ''),
-                'odds': item.get('odds', 2.0),
-                'deadline': item.get('deadline', datetime.now().isoformat()),
-                'scraped_at': datetime.now().isoformat(),
-                'source': 'api'
-            })
-        return events
+    def _scrape_via_http(self, walbi_url: str) -> Optional[List[Dict]]:
+        """Try parsing the server-rendered events page without a browser"""
+        if not self.http:
+            return None
+        
+        try:
+            response = self.http.get(
+                walbi_url,
+                timeout=HTTP_TIMEOUT,
+                headers={'User-Agent': BROWSER_USER_AGENT}
+            )
+            if response.status_code >= 400:
+                return None
+            
+            parser = _EventCardParser()
+            parser.feed(response.text)
+            parser.close()
+        except requests.RequestException as e:
+            self.logger.debug("Static HTML attempt failed: %s", e)
+            return None
+        
+        scraped_at = _now_iso()
+        events = [
+            dict(card, scraped_at=scraped_at, source='http')
+            for card in parser.cards
+            if len(card) == len(_EventCardParser.FIELDS)
+        ]
+        return events or None
     
-    def _generate_demo_events(self) -> List[Dict]:
-        """Generate synthetic events"""
-        patterns = ['CLASSIC', 'NEWSEVENT', 'VOLEVENT']
-        assets = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'AAPL', 'TSLA']
-        
-        events = []
-        for i in range(5):
-            pattern = random.choice(patterns)
-            asset = random.choice(assets)
-            events.append({
-                'title': f"{pattern}: {asset} Movement",
-                'description': f"Prediction opportunity on {asset}",
-                'pattern': pattern,
-                'asset': asset,
-                'odds': random.uniform(1.5, 2.5),
-                'deadline': (datetime.now() + timedelta(hours=random.randint(1, 24))).isoformat(),
-                'scraped_at': datetime.now().isoformat(),
-                'source': 'demo'
-            })
+    def _parse_api_events(self, data: dict) -> List[Dict]:
+        """Parse API events"""
+        scraped_at = _now_iso()
+        return [
+            {
+                'title': item.get('title', 'Unknown'),
+                'description': item.get('description', ''),
+                'odds': item.get('odds', 2.0),
+                'deadline': item.get('deadline', scraped_at),
+                'scraped_at': scraped_at,
+                'source': 'api'
+            }
+            for item in data.get('events', [])
+        ]
+    
+    def _generate_demo_events(self, n: int = 5) -> List[Dict]:
+        """
+        Generate synthetic events
         
-        return events
+        Titles, patterns and assets come from a template refreshed every
+        DEMO_TEMPLATE_TTL_S; only odds and timestamps are drawn per call.
+        """
+        rng = self._rng
+        template = self._demo_template
+        if len(template) != n or time.monotonic() >= self._demo_template_expires:
+            # Shared, never mutated: each event is a fresh dict(base, ...)
+            template = self._demo_template = rng.choices(_DEMO_EVENT_BASES, k=n)
+            self._demo_template_expires = time.monotonic() + DEMO_TEMPLATE_TTL_S
+        
+        hours = rng.choices(range(1, 25), k=n)
+        now = datetime.now()
+        scraped_at = _now_iso()
+        
+        return [
+            dict(
+                base,
+                odds=rng.uniform(1.5, 2.5),
+                deadline=(now + timedelta(hours=h)).isoformat(),
+                scraped_at=scraped_at,
+                source='demo'
+            )
+            for base, h in zip(template, hours)
+        ]
 
     def analyze_sentiment(self, text: str) -> Dict:
         """Analyze sentiment using ML or heuristic"""
-        if not self.sentiment_analyzer:
-            self.init_ml_model()
+        return self.analyze_sentiment_batch([text])[0]
+
+    def analyze_sentiment_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Analyze sentiment for a batch of texts
+        
+        One pipeline call per batch: N forward passes become
+        ceil(N / SENTIMENT_BATCH_SIZE).
+        """
+        if not texts:
+            return []
+        
+        if self._ml_thread is None:
+            self._start_ml_warmup()
+        if not self._ml_wait_expired and not self._ml_ready.wait(timeout=ML_WARMUP_TIMEOUT_S):
+            self._ml_wait_expired = True
+            self.logger.warning("ML model still loading, using heuristic sentiment until it is ready")
         
         if self.sentiment_analyzer:
+            # Recurring titles are served from the cache; only unseen
+            # texts go through the model. Full strings are passed: the
+            # tokenizer truncates to SENTIMENT_MAX_TOKENS itself.
+            cache = self._sentiment_cache
+            unique = dict.fromkeys(texts)
+            misses = [text for text in unique if text not in cache]
             try:
-                result = self.sentiment_analyzer(text[:512])[0]
-                return {
-                    'label': result['label'],
-                    'score': result['score']
-                }
+                if misses:
+                    with self._inference_ctx():
+                        results = self.sentiment_analyzer(
+                            misses,
+                            batch_size=SENTIMENT_BATCH_SIZE,
+                            truncation=True,
+                            max_length=SENTIMENT_MAX_TOKENS
+                        )
+                    for text, result in zip(misses, results):
+                        cache[text] = {'label': result['label'], 'score': result['score']}
+                sentiments = [cache[text] for text in texts]
+                
+                # LRU: refresh this batch's entries, evict the oldest
+                for text in unique:
+                    cache.move_to_end(text)
+                while len(cache) > SENTIMENT_CACHE_SIZE:
+                    cache.popitem(last=False)
+                
+                self.api_metrics.record_sentiment_cache(len(texts) - len(misses), len(misses))
+                return sentiments
             except Exception as e:
                 self.logger.warning(f"Sentiment analysis failed: {e}")
         
         # Fallback heuristic
-        positive_words = ['profit', 'gain', 'up', 'bullish', 'positive']
-        negative_words = ['loss', 'down', 'bearish', 'negative', 'risk']
-        
-        text_lower = text.lower()
-        pos_count = sum(word in text_lower for word in positive_words)
-        neg_count = sum(word in text_lower for word in negative_words)
+        return [self._heuristic_sentiment(text) for text in texts]
+
+    def _heuristic_sentiment(self, text: str) -> Dict:
+        """Keyword heuristic used when the ML model is unavailable"""
+        # Case-insensitive match; only the (few) hits are lowercased
+        hits = {word.lower() for word in self.SENTIMENT_WORD_RE.findall(text)}
+        pos_count = len(hits & self.POS_WORDS)
+        neg_count = len(hits & self.NEG_WORDS)
         
         if pos_count > neg_count:
             return {'label': 'POSITIVE', 'score': 0.6 + (pos_count * 0.1)}
         elif neg_count > pos_count:
             return {'label': 'NEGATIVE', 'score': 0.6 + (neg_count * 0.1)}
         else:
-            return {'label': 'NEUTRAL', 'score': 0.5}
+            return NEUTRAL_SENTIMENT
 
     def calculate_confidence(self, event: Dict, sentiment: Dict) -> float:
         """
@@ -531,50 +1429,79 @@ class GrailAgent:
         
         Uses parameters from config/parameters.json
         """
-        confidence = sentiment['score']
-        
-        # Pattern boost
-        pattern = event.get('pattern', 'UNKNOWN')
-        if pattern == 'NEWSEVENT':
-            confidence *= 1.2
-        elif pattern == 'CLASSIC':
-            confidence *= 1.1
-        elif pattern == 'VOLEVENT':
-            confidence *= 0.95
-        
-        # Odds adjustment
-        odds = float(event.get('odds', 2.0))
-        if 1.8 <= odds <= 2.2:
-            confidence *= 1.05
+        return self.calculate_confidence_batch([event], [sentiment])[0]
+
+    def calculate_confidence_batch(self, events: List[Dict], sentiments: List[Dict]) -> List[float]:
+        """
+        Calculate confidence scores for a batch of events
+        
+        Session-level adjustments (win rate momentum, loss streak) are
+        computed once per batch; only pattern and odds vary per event.
+        """
+        session_mult = 1.0
         
         # Win rate momentum
         if self.trades_executed > 0:
             win_rate = self.wins / self.trades_executed
             if win_rate > 0.7:
-                confidence *= 1.1
+                session_mult *= 1.1
             elif win_rate < 0.5:
-                confidence *= 0.9
+                session_mult *= 0.9
         
         # Emergency controls
         if self.consecutive_losses >= 2:
-            confidence *= 0.8
+            session_mult *= 0.8
         
-        return min(confidence, 0.98)
+        pattern_mult = PATTERN_CONFIDENCE_MULT
+        confidences = []
+        for event, sentiment in zip(events, sentiments):
+            # Pattern boost
+            confidence = sentiment['score'] * pattern_mult.get(event.get('pattern'), 1.0)
+            
+            # Odds adjustment
+            odds = float(event.get('odds', 2.0))
+            if 1.8 <= odds <= 2.2:
+                confidence *= 1.05
+            
+            confidences.append(min(confidence * session_mult, 0.98))
+        
+        return confidences
 
-    def place_prediction(self, event: Dict, confidence: float) -> Dict:
-        """Place prediction on platform"""
-        if self.emergency_stop or self.circuit_breaker_triggered:
+    def place_prediction(
+        self,
+        event: Dict,
+        confidence: float,
+        timestamp: Optional[str] = None,
+        random_draw: Optional[float] = None
+    ) -> Dict:
+        """
+        Place prediction on platform
+        
+        `timestamp` lets the caller reuse one ISO timestamp for every row
+        written in an iteration; defaults to now. `random_draw` is the
+        pre-rolled uniform draw deciding a demo outcome; drawn here if
+        not supplied.
+        """
+        if self.emergency_stop:
             self.logger.warning("🚨 Trading halted")
             return {'status': 'blocked', 'reason': 'emergency_stop'}
         
-        position_size = self.bankroll * 0.02
-        if position_size > self.bankroll * 0.1:
-            position_size = self.bankroll * 0.1
+        if self.circuit_breaker_triggered:
+            if time.monotonic() < self._cb_until:
+                return {'status': 'blocked', 'reason': 'cooldown'}
+            self.circuit_breaker_triggered = False
+            self.logger.info("Circuit breaker reset")
+        
+        position_size = _position_size(self.bankroll)
         
-        trade_id = f"trade_{self.trades_executed + 1}_{int(time.time())}"
+        if timestamp is None:
+            timestamp = _now_iso()
+        trade_id = self._trade_id_prefix + str(self.trades_executed + 1)
         
         if self.mode == "demo":
-            outcome = random.random() < confidence
+            if random_draw is None:
+                random_draw = self._rng.random()
+            outcome = random_draw < confidence
             if outcome:
                 profit = position_size * (float(event.get('odds', 2.0)) - 1)
                 result = 'WIN'
@@ -603,9 +1530,22 @@ class GrailAgent:
             'result': result,
             'profit_loss': profit,
             'bankroll': self.bankroll,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp
         }
         
+        # The local journal is best-effort: the trade has already happened,
+        # so a store error must not skip logging or the health check
+        try:
+            self._db.execute(
+                "INSERT INTO trades (id, timestamp, event, pattern, confidence, position_size, "
+                "odds, result, profit_loss, bankroll, session_id) VALUES (:id, :timestamp, "
+                ":event, :pattern, :confidence, :position_size, :odds, :result, :profit_loss, "
+                ":bankroll, :session_id)",
+                # session_id is local bookkeeping; the Supabase row doesn't carry it
+                dict(trade_data, session_id=self.session_id)
+            )
+        except sqlite3.Error as e:
+            self.logger.error("Failed to journal trade %s: %s", trade_id, e)
         self._log_trade(trade_data)
         self._health_check()
         
@@ -613,21 +1553,183 @@ class GrailAgent:
             self.save_checkpoint(self.trades_executed)
         
         self.logger.info(
-            f"Trade {self.trades_executed}: {result} | "
-            f"P/L: ${profit:+.2f} | Bankroll: ${self.bankroll:.2f}"
+            "Trade %d: %s | P/L: $%+.2f | Bankroll: $%.2f",
+            self.trades_executed, result, profit, self.bankroll
         )
         
         return trade_data
 
+    def run_fast_demo(self, num_predictions: int = 200):
+        """
+        Run a whole demo session without per-trade I/O or pacing
+        
+        Events, sentiment and confidence are computed as one batch up
+        front (session multipliers as of the start), then the P/L rollout
+        runs in _simulate_demo_session. Only the totals are applied to the
+        agent; no per-trade rows are written. The same guards as run()
+        apply: a halted session doesn't trade, and the Overlord execution
+        guard can end or cap the session.
+        
+        One checkpoint is saved at the end, keyed like run()'s milestone
+        checkpoints by the trade count at the time it is taken.
+        """
+        self.logger.info(f"Starting fast demo rollout: {num_predictions} predictions")
+        
+        num_predictions = self._prediction_budget(num_predictions)
+        if self.emergency_stop:
+            self.logger.error("Trading halted")
+            num_predictions = None
+        if num_predictions is None:
+            self.print_summary()
+            return
+        
+        events = self._generate_demo_events(num_predictions)
+        texts = [f"{e['title']} {e.get('description', '')}" for e in events]
+        sentiments = self.analyze_sentiment_batch(texts)
+        confidences = self.calculate_confidence_batch(events, sentiments)
+        
+        threshold = self.config_loader.confidence_threshold
+        traded = [(c, float(e['odds'])) for e, c in zip(events, confidences) if c > threshold]
+        rng = self._rng.random
+        
+        profits, wins, losses, bankroll, streak, trips = _simulate_demo_session(
+            [c for c, _ in traded],
+            [o for _, o in traded],
+            [rng() for _ in traded],
+            self.bankroll,
+            self.max_consecutive_losses,
+            self.min_bankroll_threshold,
+            self.consecutive_losses
+        )
+        
+        self.trades_executed += len(profits)
+        self.consecutive_losses = streak
+        self.wins += wins
+        self.losses += losses
+        self.total_profit += bankroll - self.bankroll
+        self.bankroll = bankroll
+        if bankroll < self.min_bankroll_threshold:
+            self.logger.error(
+                f"🚨 EMERGENCY STOP: Bankroll ${bankroll:.2f} below threshold"
+            )
+            self.emergency_stop = True
+        if trips:
+            self.logger.warning(f"⚠️  Circuit breaker tripped {trips} times")
+        
+        self.save_checkpoint(self.trades_executed)
+        self.print_summary()
+
+    def simulate_batch(self, events: List[Dict], confidences: List[float]) -> List[float]:
+        """
+        Simulate a sequence of demo trades without touching agent state
+        
+        Uses the same rollout as run_fast_demo(), from the current
+        bankroll and loss streak, with run()'s emergency stop and
+        circuit breaker.
+        Intended for Monte-Carlo and backtesting runs; returns the
+        profit/loss of each trade placed.
+        """
+        profits, _, _, _, _, _ = _simulate_demo_session(
+            confidences,
+            [float(event.get('odds', 2.0)) for event in events],
+            [self._rng.random() for _ in events],
+            self.bankroll,
+            self.max_consecutive_losses,
+            self.min_bankroll_threshold,
+            self.consecutive_losses
+        )
+        return profits
+
     def _log_trade(self, trade_data: Dict):
-        """Log trade to Supabase"""
+        """Queue trade for the background Supabase writer"""
         if not self.supabase:
             return
+        self._enqueue_row('trades', trade_data)
+
+    def _enqueue_row(self, table: str, row: Dict):
+        """Hand a row to the Supabase writer without ever blocking the caller"""
+        try:
+            self._log_q.put_nowait((table, row))
+        except queue.Full:
+            # Supabase is far behind; trading must not wait for it
+            self.api_metrics.supabase_dropped += 1
+            if self.api_metrics.supabase_dropped == 1:
+                self.logger.warning("Supabase writer queue full, dropping rows")
+
+    def _start_log_worker(self):
+        """Start the background thread that owns Supabase writes"""
+        self._log_thread = threading.Thread(
+            target=self._log_worker,
+            name='supabase-writer',
+            daemon=True
+        )
+        self._log_thread.start()
+
+    def _log_worker(self):
+        """
+        Drain the log queue into batched Supabase inserts
+        
+        A table is flushed when it buffers `_flush_every` rows; everything
+        is flushed at least every `_flush_interval` seconds so slow
+        sessions don't sit on rows until the next checkpoint.
+        """
+        buffers = {'trades': self._trade_buf, 'predictions': self._pred_buf}
+        deadline = time.monotonic() + self._flush_interval
+        while True:
+            try:
+                item = self._log_q.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+            try:
+                if isinstance(item, tuple):
+                    table, row = item
+                    buffer = buffers[table]
+                    buffer.append(row)
+                    if len(buffer) >= self._flush_every:
+                        self._flush_table(table, buffer)
+                if not isinstance(item, tuple) or time.monotonic() >= deadline:
+                    for table, buffer in buffers.items():
+                        self._flush_table(table, buffer)
+                    deadline = time.monotonic() + self._flush_interval
+                if item is _LOG_STOP:
+                    return
+            except Exception as e:
+                self.logger.error(f"Supabase writer error: {e}")
+            finally:
+                if item is not None:
+                    self._log_q.task_done()
+
+    def _flush_supabase(self, wait: bool = True):
+        """Ask the writer to flush all buffered rows, optionally waiting for it"""
+        if not self._log_thread or not self._log_thread.is_alive():
+            return
+        if wait:
+            self._log_q.put(_LOG_FLUSH)
+            self._log_q.join()
+            return
         try:
-            self.supabase.table('trades').insert(trade_data).execute()
+            self._log_q.put_nowait(_LOG_FLUSH)
+        except queue.Full:
+            # A full queue keeps the writer flushing anyway; don't stall trading
+            pass
+
+    def _flush_table(self, table: str, buffer: List[Dict]):
+        """
+        Insert buffered rows in a single request
+        
+        Rows stay buffered on failure and are retried on the next flush.
+        """
+        if not self.supabase or not buffer:
+            return
+        rows = buffer[:]
+        try:
+            self.supabase.table(table).insert(rows).execute()
+            del buffer[:len(rows)]
+            if table == 'predictions':
+                self.predictions_logged += len(rows)
             self.api_metrics.record_supabase(True)
         except Exception as e:
-            self.logger.error(f"Failed to log trade: {e}")
+            self.logger.error(f"Failed to log {len(rows)} {table} rows: {e}")
             self.api_metrics.record_supabase(False)
 
     def _health_check(self):
@@ -637,9 +1739,7 @@ class GrailAgent:
                 f"⚠️  Circuit breaker: {self.consecutive_losses} consecutive losses"
             )
             self.circuit_breaker_triggered = True
-            time.sleep(300)
-            self.circuit_breaker_triggered = False
-            self.logger.info("Circuit breaker reset")
+            self._cb_until = time.monotonic() + CIRCUIT_BREAKER_COOLDOWN_S
         
         if self.bankroll < self.min_bankroll_threshold:
             self.logger.error(
@@ -649,6 +1749,8 @@ class GrailAgent:
 
     def save_checkpoint(self, checkpoint_id: int):
         """Save checkpoint"""
+        self._flush_supabase(wait=False)
+        
         checkpoint_file = self.checkpoint_dir / f"checkpoint_{checkpoint_id}.json"
         
         win_rate = (self.wins / self.trades_executed * 100) if self.trades_executed > 0 else 0
@@ -656,7 +1758,7 @@ class GrailAgent:
         
         checkpoint_data = {
             'checkpoint_id': checkpoint_id,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _now_iso(),
             'trades_executed': self.trades_executed,
             'wins': self.wins,
             'losses': self.losses,
@@ -666,27 +1768,81 @@ class GrailAgent:
             'bankroll': self.bankroll,
             'initial_bankroll': self.initial_bankroll,
             'emergency_stop': self.emergency_stop,
-            'circuit_breaker_triggered': self.circuit_breaker_triggered
+            'circuit_breaker_triggered': self.circuit_breaker_triggered,
+            # Replay offset within this session's trades
+            'last_trade_seq': self._db.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM trades WHERE session_id = ?",
+                (self.session_id,)
+            ).fetchone()[0],
+            'session_id': self.session_id
         }
         
+        # Re-saving the same checkpoint with unchanged state is a no-op
+        state = {k: v for k, v in checkpoint_data.items() if k != 'timestamp'}
+        digest = hashlib.blake2s(_dump_json(state), digest_size=8).digest()
+        if self._last_checkpoint == (checkpoint_id, digest):
+            self.logger.debug(f"Checkpoint {checkpoint_id} unchanged, not rewritten")
+            return
+        
         try:
-            with open(checkpoint_file, 'w') as f:
-                json.dump(checkpoint_data, f, indent=2)
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES ("
+                ":checkpoint_id, :timestamp, :trades_executed, :wins, :losses, "
+                ":total_profit, :bankroll, :initial_bankroll, :emergency_stop, "
+                ":circuit_breaker_triggered, :last_trade_seq, :session_id)",
+                checkpoint_data
+            )
+            # JSON copy for CI artifacts and external tooling, written in
+            # the background (checkpoint_data is not touched after this)
+            self._ckpt_pool.submit(
+                self._write_checkpoint_file,
+                checkpoint_file,
+                checkpoint_data,
+                self.logger.isEnabledFor(logging.DEBUG)
+            )
+            self._last_checkpoint = (checkpoint_id, digest)
             self.logger.info(f"✓ Checkpoint {checkpoint_id} saved")
         except Exception as e:
             self.logger.error(f"Failed to save checkpoint: {e}")
 
+    def _write_checkpoint_file(self, checkpoint_file: Path, checkpoint_data: Dict, indent: bool):
+        """Write a checkpoint's JSON copy (runs on the checkpoint worker)"""
+        try:
+            # Pretty-printed only when debugging; nothing reads the whitespace
+            write_atomic(
+                checkpoint_file, _dump_json(checkpoint_data, indent=indent), durable=True
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to write {checkpoint_file.name}: {e}")
+
+    def _await_checkpoint_writes(self):
+        """Block until every queued checkpoint file has been written"""
+        self._ckpt_pool.submit(lambda: None).result()
+
     def load_checkpoint(self, checkpoint_id: int) -> bool:
-        """Load checkpoint"""
-        checkpoint_file = self.checkpoint_dir / f"checkpoint_{checkpoint_id}.json"
+        """
+        Load checkpoint
         
-        if not checkpoint_file.exists():
-            self.logger.warning(f"Checkpoint {checkpoint_id} not found")
-            return False
+        Checkpoint IDs repeat across sessions: this session's checkpoint
+        wins, otherwise the most recently saved one with that ID.
+        """
+        checkpoint_file = self.checkpoint_dir / f"checkpoint_{checkpoint_id}.json"
         
         try:
-            with open(checkpoint_file, 'r') as f:
-                data = json.load(f)
+            row = self._db.execute(
+                "SELECT * FROM checkpoints WHERE checkpoint_id = ? "
+                "ORDER BY session_id = ? DESC, rowid DESC LIMIT 1",
+                (checkpoint_id, self.session_id)
+            ).fetchone()
+            if row is not None:
+                data = dict(row)
+            else:
+                self._await_checkpoint_writes()
+                try:
+                    data = _load_json(checkpoint_file.read_bytes())
+                except FileNotFoundError:
+                    self.logger.warning(f"Checkpoint {checkpoint_id} not found")
+                    return False
             
             self.trades_executed = data['trades_executed']
             self.wins = data['wins']
@@ -694,8 +1850,17 @@ class GrailAgent:
             self.total_profit = data['total_profit']
             self.bankroll = data['bankroll']
             self.initial_bankroll = data['initial_bankroll']
-            self.emergency_stop = data['emergency_stop']
-            self.circuit_breaker_triggered = data['circuit_breaker_triggered']
+            self.emergency_stop = bool(data['emergency_stop'])
+            self.circuit_breaker_triggered = bool(data['circuit_breaker_triggered'])
+            
+            # Continue the checkpointed session: replay only its trades and
+            # keep numbering its trade IDs
+            session_id = data.get('session_id')
+            if session_id:
+                self._set_session(session_id)
+            replayed = self._replay_trades(session_id or '', data.get('last_trade_seq'))
+            if replayed:
+                self.logger.info(f"Replayed {replayed} trades after checkpoint {checkpoint_id}")
             
             self.logger.info(f"✓ Checkpoint {checkpoint_id} loaded")
             return True
@@ -703,63 +1868,133 @@ class GrailAgent:
             self.logger.error(f"Failed to load checkpoint: {e}")
             return False
 
+    def _set_session(self, session_id: str):
+        """Attribute subsequent trades and checkpoints to `session_id`"""
+        self.session_id = session_id
+        self._trade_id_prefix = f"trade_{session_id}_"
+
+    def _replay_trades(self, session_id: str, last_seq: Optional[int]) -> int:
+        """
+        Apply a session's trades recorded after a checkpoint
+        
+        Returns the number of trades replayed.
+        """
+        if last_seq is None:
+            return 0
+        
+        rows = self._db.execute(
+            "SELECT result, profit_loss, bankroll FROM trades "
+            "WHERE session_id = ? AND seq > ? ORDER BY seq",
+            (session_id, last_seq)
+        ).fetchall()
+        for result, profit_loss, bankroll in rows:
+            self.trades_executed += 1
+            if result == 'WIN':
+                self.wins += 1
+                self.consecutive_losses = 0
+            else:
+                self.losses += 1
+                self.consecutive_losses += 1
+            self.total_profit += profit_loss
+            self.bankroll = bankroll
+        return len(rows)
+
+    def _prediction_budget(self, num_predictions: int) -> Optional[int]:
+        """
+        Apply the Overlord execution guard before a session
+        
+        Returns the number of predictions allowed (capped by the guard's
+        limit), or None when the guard asks for an early CI exit.
+        """
+        if not self.execution_guard:
+            return num_predictions
+        
+        should_exit, exit_reason = self.execution_guard.should_exit_ci()
+        if should_exit:
+            self.logger.warning(f"Overlord: Early exit - {exit_reason}")
+            return None
+        
+        pred_limit = self.execution_guard.get_prediction_limit()
+        if pred_limit and pred_limit < num_predictions:
+            self.logger.info(f"Overlord: Limit enforced: {pred_limit}")
+            return pred_limit
+        return num_predictions
+
     def run(self, num_predictions: int = 20):
         """Execute trading session"""
         self.logger.info(f"Starting Grail Agent: {num_predictions} predictions")
         
-        if self.execution_guard:
-            should_exit, exit_reason = self.execution_guard.should_exit_ci()
-            if should_exit:
-                self.logger.warning(f"Overlord: Early exit - {exit_reason}")
-                self.print_summary()
-                return
-            
-            pred_limit = self.execution_guard.get_prediction_limit()
-            if pred_limit and pred_limit < num_predictions:
-                self.logger.info(f"Overlord: Limit enforced: {pred_limit}")
-                num_predictions = pred_limit
+        num_predictions = self._prediction_budget(num_predictions)
+        if num_predictions is None:
+            self.print_summary()
+            return
+        
+        # Demo outcomes for the whole session, rolled up front
+        rng = self._rng.random
+        outcome_draws = [rng() for _ in range(num_predictions)]
+        
+        # Scored events from the last scrape, best first
+        ranked: deque = deque()
         
         for i in range(num_predictions):
             if self.emergency_stop:
                 self.logger.error("Trading halted")
                 break
             
+            # Pace iterations start-to-start: only sleep for whatever is
+            # left of the interval after the previous iteration's work
+            now = time.monotonic()
+            if now < self._next_slot:
+                time.sleep(self._next_slot - now)
+            self._next_slot = time.monotonic() + PREDICTION_INTERVAL_S
+            
             if self.overlord_controller:
                 try:
-                    current_metrics = {
-                        'api_first_score': self.api_metrics.get_api_first_score(),
-                        'ui_fallbacks': self.api_metrics.metrics['ui_fallbacks'],
-                        'demo_fallbacks': self.api_metrics.metrics['demo_fallbacks'],
-                        'supabase_success_rate': self.api_metrics._supabase_success_rate()
-                    }
-                    self.overlord_controller.evaluate_and_apply(current_metrics)
+                    # Refreshed in place; the controller only reads it
+                    metrics_view = self._metrics_view
+                    api_metrics = self.api_metrics
+                    metrics_view['api_first_score'] = api_metrics.get_api_first_score()
+                    metrics_view['ui_fallbacks'] = api_metrics.ui_fallbacks
+                    metrics_view['demo_fallbacks'] = api_metrics.demo_fallbacks
+                    metrics_view['supabase_success_rate'] = api_metrics._supabase_success_rate()
+                    self.overlord_controller.evaluate_and_apply(metrics_view)
                 except Exception as e:
-                    self.logger.debug(f"Overlord evaluation failed: {e}")
+                    self.logger.debug("Overlord evaluation failed: %s", e)
             
             try:
-                events = self.scrape_walbi_events()
-                if not events:
-                    self.logger.warning("No events found")
-                    time.sleep(60)
-                    continue
+                # Scrape and score only once the previous batch is used up
+                if not ranked:
+                    events = self.scrape_walbi_events()
+                    if not events:
+                        self.logger.warning("No events found")
+                        self._next_slot = time.monotonic() + NO_EVENTS_BACKOFF_S
+                        continue
+                    ranked.extend(self._rank_events(events))
                 
-                event = random.choice(events)
-                text = f"{event['title']} {event.get('description', '')}"
-                sentiment = self.analyze_sentiment(text)
+                # The batch only fixes the order; confidence is rescored so
+                # losses earlier in the batch still damp the next trade
+                event, sentiment, _ = ranked.popleft()
                 confidence = self.calculate_confidence(event, sentiment)
                 
-                self._log_prediction(event, sentiment, confidence)
+                # One timestamp for the prediction row and its trade
+                ts = _now_iso()
+                self._log_prediction(event, sentiment, confidence, ts)
                 
-                if confidence > self.config_loader.get_parameter('confidence_threshold', 0.70):
-                    trade_result = self.place_prediction(event, confidence)
+                if confidence > self.config_loader.confidence_threshold:
+                    trade_result = self.place_prediction(
+                        event, confidence, ts, random_draw=outcome_draws[i]
+                    )
                     if trade_result.get('status') == 'blocked':
-                        break
+                        if trade_result.get('reason') != 'cooldown':
+                            break
+                        # Hold off the next iteration until the breaker resets
+                        self._next_slot = max(self._next_slot, self._cb_until)
                 else:
                     self.logger.info(
-                        f"Skipping: confidence {confidence:.2%} < threshold"
+                        "Skipping: confidence %.2f%% < threshold", confidence * 100
                     )
-                
-                time.sleep(2)
+                    # The rest of the batch ranks lower still; rescrape
+                    ranked.clear()
                 
             except Exception as e:
                 self.logger.error(f"Error in prediction {i+1}: {e}")
@@ -767,25 +2002,43 @@ class GrailAgent:
         
         self.print_summary()
 
-    def _log_prediction(self, event: Dict, sentiment: Dict, confidence: float):
-        """Log prediction"""
+    def _rank_events(self, events: List[Dict]) -> List[Tuple[Dict, Dict, float]]:
+        """
+        Score a scraped batch in one pass and rank it for trading
+        
+        Returns up to EVENTS_PER_SCRAPE (event, sentiment, confidence)
+        tuples, highest confidence first.
+        """
+        texts = [f"{e['title']} {e.get('description', '')}" for e in events]
+        sentiments = self.analyze_sentiment_batch(texts)
+        confidences = self.calculate_confidence_batch(events, sentiments)
+        scored = sorted(
+            zip(events, sentiments, confidences),
+            key=lambda item: item[2],
+            reverse=True
+        )
+        return scored[:EVENTS_PER_SCRAPE]
+
+    def _log_prediction(
+        self,
+        event: Dict,
+        sentiment: Dict,
+        confidence: float,
+        timestamp: Optional[str] = None
+    ):
+        """Buffer prediction for a batched Supabase insert"""
         if not self.supabase:
             return
-        try:
-            prediction_data = {
-                'event_name': event['title'],
-                'sentiment_label': sentiment['label'],
-                'sentiment_score': sentiment['score'],
-                'confidence': confidence,
-                'mode': self.mode,
-                'timestamp': datetime.now().isoformat()
-            }
-            self.supabase.table('predictions').insert(prediction_data).execute()
-            self.predictions_logged += 1
-            self.api_metrics.record_supabase(True)
-        except Exception as e:
-            self.logger.error(f"Failed to log prediction: {e}")
-            self.api_metrics.record_supabase(False)
+        if timestamp is None:
+            timestamp = _now_iso()
+        self._enqueue_row('predictions', {
+            'event_name': event['title'],
+            'sentiment_label': sentiment['label'],
+            'sentiment_score': sentiment['score'],
+            'confidence': confidence,
+            'mode': self.mode,
+            'timestamp': timestamp
+        })
 
     def run_smoke_test(self):
         """Run smoke test"""
@@ -793,189 +2046,233 @@ class GrailAgent:
         self.logger.info("🔥 SMOKE TEST MODE")
         self.logger.info("═" * 50)
         
+        # (name, check, uses the agent's RNG / demo template)
+        smoke_checks = (
+            ("Logging", self._smoke_logging, False),
+            ("Config Loader", self._smoke_config_loader, False),
+            ("Supabase", self._smoke_supabase, False),
+            ("Demo Events", self._smoke_demo_events, True),
+            ("Confidence Logic", self._smoke_confidence, True),
+            ("Checkpoints", self._smoke_checkpoints, False),
+        )
+        
         checks = []
         start_time = time.time()
         
-        # Check 1: Logging
-        try:
-            self.logger.info("✓ Check 1/6: Logging system")
-            checks.append(("Logging", True))
-        except Exception as e:
-            self.logger.error(f"Logging failed: {e}")
-            checks.append(("Logging", False))
+        # I/O checks run side by side; checks drawing from self._rng share one
+        # worker so they run in order and GRAIL_SEED stays reproducible.
+        # Results are reported in definition order either way.
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(smoke_checks), thread_name_prefix='smoke'
+        )
+        serial = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='smoke-rng'
+        )
+        futures = [
+            (serial if uses_rng else pool).submit(check)
+            for _, check, uses_rng in smoke_checks
+        ]
+        deadline = time.monotonic() + SMOKE_CHECK_TIMEOUT_S
         
-        # Check 2: Config loader (STEP 6)
-        try:
-            if self.config_loader:
-                params = self.config_loader.get_all_parameters()
-                if params:
-                    self.logger.info(f"✓ Check 2/6: Config loader ({len(params)} params)")
-                    checks.append(("Config Loader", True))
-                else:
-                    checks.append(("Config Loader", False))
-            else:
-                checks.append(("Config Loader", False))
-        except Exception as e:
-            self.logger.error(f"Config loader failed: {e}")
-            checks.append(("Config Loader", False))
+        for number, ((name, _, _), future) in enumerate(zip(smoke_checks, futures), 1):
+            checks.append((name, self._run_smoke_check(
+                name, lambda: self._smoke_result(future, deadline), number, len(smoke_checks)
+            )))
+        # A hung check must not keep the smoke test from reporting
+        pool.shutdown(wait=False, cancel_futures=True)
+        serial.shutdown(wait=False, cancel_futures=True)
         
-        # Check 3: Supabase
-        try:
-            if self.supabase:
-                result = self.supabase.table('predictions').select('*').limit(1).execute()
-                self.logger.info("✓ Check 3/6: Supabase connection")
-                checks.append(("Supabase", True))
-                self.api_metrics.record_supabase(True)
-            else:
-                self.logger.info("⊚ Check 3/6: Supabase not configured")
-                checks.append(("Supabase", None))
-        except Exception as e:
-            self.logger.error(f"Supabase failed: {e}")
-            checks.append(("Supabase", False))
-            if self.supabase:
-                self.api_metrics.record_supabase(False)
+        # Summary
+        elapsed = time.time() - start_time
+        counts = Counter(status for _, status in checks)
+        passed, failed, skipped = counts[True], counts[False], counts[None]
+        failed_names = [name for name, status in checks if status is False] if failed else []
+        total = len(checks)
         
-        # Check 4: Demo events
-        try:
-            events = self._generate_demo_events()
-            if len(events) >= 1:
-                self.logger.info(f"✓ Check 4/6: Demo events ({len(events)} generated)")
-                checks.append(("Demo Events", True))
-            else:
-                checks.append(("Demo Events", False))
-        except Exception as e:
-            self.logger.error(f"Demo events failed: {e}")
-            checks.append(("Demo Events", False))
+        # One record for log collectors; the `smoke` attribute carries the fields
+        result = {
+            'elapsed_s': round(elapsed, 3),
+            'total': total,
+            'passed': passed,
+            'failed': failed,
+            'skipped': skipped,
+            'failed_checks': failed_names,
+        }
+        self.logger.log(
+            logging.ERROR if failed else logging.INFO,
+            "%s SMOKE TEST %s (%.1fs): %d passed, %d failed, %d skipped%s",
+            "🔴" if failed else "✅", "FAILED" if failed else "PASSED", elapsed,
+            passed, failed, skipped, " [%s]" % ", ".join(failed_names) if failed else "",
+            extra={'smoke': result}
+        )
         
-        # Check 5: Confidence logic
-        try:
-            if len(events) > 0:
-                event = events[0]
-                sentiment = {'label': 'NEUTRAL', 'score': 0.5}
-                confidence = self.calculate_confidence(event, sentiment)
-                
-                if 0.0 < confidence <= 1.0:
-                    self.logger.info(f"✓ Check 5/6: Confidence logic ({confidence:.2%})")
-                    checks.append(("Confidence Logic", True))
-                else:
-                    checks.append(("Confidence Logic", False))
-            else:
-                checks.append(("Confidence Logic", False))
-        except Exception as e:
-            self.logger.error(f"Confidence logic failed: {e}")
-            checks.append(("Confidence Logic", False))
+        # Interactive runs also get the boxed tally
+        if sys.stdout.isatty():
+            sys.stdout.write(
+                "%s\n🔥 SMOKE TEST COMPLETE (%.1fs)\n"
+                "   Total:   %d\n   Passed:  %d\n   Failed:  %d\n   Skipped: %d\n%s\n"
+                % ("═" * 50, elapsed, total, passed, failed, skipped, "═" * 50)
+            )
         
-        # Check 6: Checkpoint directory (STEP 6)
+        # Release resources and flush logs ourselves, then skip interpreter
+        # teardown (atexit hooks, finalizers, a possibly hung check thread)
+        self.cleanup()
+        logging.shutdown()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1 if failed else 0)
+
+    def _run_smoke_check(self, name: str, check, number: int, total: int) -> Optional[bool]:
+        """
+        Run one smoke check and log its outcome
+        
+        Checks return (status, detail): True passed, False failed,
+        None skipped. An exception counts as a failure.
+        """
         try:
-            self.checkpoint_dir.mkdir(exist_ok=True)
-            test_file = self.checkpoint_dir / ".smoke_test"
-            test_file.write_text(f"test {datetime.now().isoformat()}")
-            test_file.unlink()
-            self.logger.info("✓ Check 6/6: Checkpoint directory writable")
-            checks.append(("Checkpoints", True))
+            status, detail = check()
         except Exception as e:
-            self.logger.error(f"Checkpoint directory failed: {e}")
-            checks.append(("Checkpoints", False))
-        
-        # Summary
-        elapsed = time.time() - start_time
-        passed = sum(1 for _, status in checks if status is True)
-        failed = sum(1 for _, status in checks if status is False)
-        skipped = sum(1 for _, status in checks if status is None)
-        total = passed + failed + skipped
-        
-        self.logger.info("═" * 50)
-        self.logger.info(f"🔥 SMOKE TEST COMPLETE ({elapsed:.1f}s)")
-        self.logger.info(f"   Total:   {total}")
-        self.logger.info(f"   Passed:  {passed}")
-        self.logger.info(f"   Failed:  {failed}")
-        self.logger.info(f"   Skipped: {skipped}")
-        self.logger.info("═" * 50)
+            self.logger.error("%s failed: %s", name, e)
+            return False
         
-        if failed > 0:
-            self.logger.error("\n🔴 SMOKE TEST FAILED")
-            sys.exit(1)
+        if status is None:
+            self.logger.info("⊚ Check %d/%d: %s", number, total, detail)
+        elif status:
+            self.logger.info("✓ Check %d/%d: %s", number, total, detail)
         else:
-            self.logger.info("\n✅ SMOKE TEST PASSED")
-            sys.exit(0)
+            self.logger.error("✗ Check %d/%d: %s", number, total, detail)
+        return status
+    
+    @staticmethod
+    def _smoke_result(future: concurrent.futures.Future, deadline: float):
+        """Wait for a submitted smoke check until the shared deadline"""
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except concurrent.futures.TimeoutError:
+            raise TimeoutError("no result within %.0fs" % SMOKE_CHECK_TIMEOUT_S) from None
+    
+    def _smoke_logging(self) -> Tuple[Optional[bool], str]:
+        """Smoke check 1: logging is configured"""
+        return True, "Logging system"
+    
+    def _smoke_config_loader(self) -> Tuple[Optional[bool], str]:
+        """Smoke check 2: STEP 6 config loader returns parameters"""
+        if not self.config_loader:
+            return False, "Config loader not initialized"
+        params = self.config_loader.get_all_parameters()
+        if not params:
+            return False, "Config loader returned no params"
+        return True, "Config loader (%d params)" % len(params)
+    
+    def _smoke_supabase(self) -> Tuple[Optional[bool], str]:
+        """Smoke check 3: Supabase answers a one-row query (skipped if unset)"""
+        if not self.supabase:
+            return None, "Supabase not configured"
+        try:
+            self.supabase.table('predictions').select('*').limit(1).execute()
+        except Exception:
+            self.api_metrics.record_supabase(False)
+            raise
+        self.api_metrics.record_supabase(True)
+        return True, "Supabase connection"
+    
+    def _smoke_demo_events(self) -> Tuple[Optional[bool], str]:
+        """Smoke check 4: demo events can be generated"""
+        events = self._generate_demo_events()
+        if not events:
+            return False, "Demo events (none generated)"
+        return True, "Demo events (%d generated)" % len(events)
+    
+    def _smoke_confidence(self) -> Tuple[Optional[bool], str]:
+        """Smoke check 5: confidence for a neutral demo event is in (0, 1]"""
+        events = self._generate_demo_events()
+        if not events:
+            return False, "Confidence logic (no demo event to score)"
+        confidence = self.calculate_confidence(events[0], NEUTRAL_SENTIMENT)
+        return 0.0 < confidence <= 1.0, "Confidence logic (%.2f%%)" % (confidence * 100)
+    
+    def _smoke_checkpoints(self) -> Tuple[Optional[bool], str]:
+        """Smoke check 6: checkpoint directory exists and is writable"""
+        self.checkpoint_dir.mkdir(exist_ok=True)
+        if not os.access(self.checkpoint_dir, os.W_OK):
+            # access() can be wrong on some network mounts; probe for real
+            test_file = self.checkpoint_dir / ".smoke_test"
+            fd = os.open(test_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, b"test")
+            finally:
+                os.close(fd)
+            os.unlink(test_file)
+        return True, "Checkpoint directory writable"
 
     def print_summary(self):
         """Print session summary with Overlord Supreme Report"""
+        self._flush_supabase()
+        
         win_rate = (self.wins / self.trades_executed * 100) if self.trades_executed > 0 else 0
         roi = (self.total_profit / self.initial_bankroll * 100) if self.initial_bankroll > 0 else 0
         
         api_summary = self.api_metrics.get_summary()
         api_score = api_summary['api_first_score']
         ui_fallbacks = api_summary['ui_fallbacks']
+        supabase_rate = api_summary['supabase_success_rate']
         
-        summary = f"""
-╔═══════════════════════════════════════════════════════════════╗
-║              GRAIL AGENT SESSION SUMMARY                      ║
-╠═══════════════════════════════════════════════════════════════╣
-║                                                               ║
-║  Mode: {self.mode.upper():20s}                                ║
-║  Trades Executed: {self.trades_executed:3d}                                      ║
-║  Wins: {self.wins:3d}  |  Losses: {self.losses:3d}                               ║
-║  Win Rate: {win_rate:6.2f}%                                         ║
-║                                                               ║
-║  Initial Bankroll: ${self.initial_bankroll:10.2f}                       ║
-║  Final Bankroll:   ${self.bankroll:10.2f}                       ║
-║  Total P/L:        ${self.total_profit:+10.2f}                       ║
-║  ROI:              {roi:+6.2f}%                                     ║
-║                                                               ║
-║  Emergency Stop: {'YES' if self.emergency_stop else 'NO':5s}                                 ║
-║  Circuit Breaker: {'TRIGGERED' if self.circuit_breaker_triggered else 'CLOSED':10s}                          ║
-║                                                               ║
-╠═══════════════════════════════════════════════════════════════╣
-║              API-FIRST COMPLIANCE METRICS                     ║
-╠═══════════════════════════════════════════════════════════════╣
-║                                                               ║
-║  API-First Score: {api_score:6.1f}%                                    ║
-║  UI Fallbacks:    {ui_fallbacks:3d}                                        ║
-║  Supabase:        {api_summary['supabase_success_rate']:6.1f}% success                           ║
-║                                                               ║
-╠═══════════════════════════════════════════════════════════════╣
-║          STEP 6: OVERLORD SUPREME INTEGRATION                ║
-╠═══════════════════════════════════════════════════════════════╣
-║                                                               ║
-║  ConfigLoader:        ✓ Loaded and active                    ║
-║  PlanApprover:        ✓ Ready for human approval             ║
-║  SafeExecutor:        ✓ Ready for SAFE plan execution       ║
-║  ApprovalRegistry:    ✓ Tracking approved plans              ║
-║  Autonomy Level:      2.5 (Sanctioned Execution)             ║
-║                                                               ║
-║  Configuration Source: config/parameters.json                ║
-║  Approval Status:      No pending approvals                  ║
-║  Applied SAFE Plans:   0 (Ready for execution)               ║
-║                                                               ║
-╚═══════════════════════════════════════════════════════════════╝
-"""
-        self.logger.info(summary)
-        print(summary)
+        # Everything meant for the terminal goes out in a single write at the end
+        out = []
+        
+        summary = _SUMMARY_TEMPLATE % {
+            'mode': self.mode.upper(),
+            'trades_executed': self.trades_executed,
+            'wins': self.wins,
+            'losses': self.losses,
+            'win_rate': win_rate,
+            'initial_bankroll': self.initial_bankroll,
+            'bankroll': self.bankroll,
+            'total_profit': self.total_profit,
+            'roi': roi,
+            'emergency_stop': 'YES' if self.emergency_stop else 'NO',
+            'circuit_breaker': 'TRIGGERED' if self.circuit_breaker_triggered else 'CLOSED',
+            'api_score': api_score,
+            'ui_fallbacks': ui_fallbacks,
+            'supabase_rate': supabase_rate,
+        }
+        out.append(summary)
+        # The log file gets a copy (at INFO); the console already shows `out`
+        self.logger.info(summary, extra={'file_only': True})
 
-            # STEP 7: Supreme Report v2 (reporting only, if enabled)
-            if hasattr(self, 'step7_enabled') and self.step7_enabled:
-                try:
-                    self._generate_supreme_report_v2()
-                except Exception as e:
-                    self.logger.warning(f"⚠️  Supreme Report generation failed: {e}")
-                    # Graceful degradation: continue without report
+        # STEP 7: Supreme Report v2 (reporting only, if enabled)
+        if hasattr(self, 'step7_enabled') and self.step7_enabled:
+            try:
+                supreme_report = self._generate_supreme_report_v2()
+                if supreme_report:
+                    out.append(supreme_report)
+            except Exception as e:
+                self.logger.warning("⚠️  Supreme Report generation failed: %s", e)
+                # Graceful degradation: continue without report
 
+        # Overlord Sentinel Report: an empty session has no baseline to record,
+        # and smoke runs don't set the sentinel up at all
+        if self.baseline_collector is None or self.trades_executed == 0:
+            self.logger.debug("Overlord Sentinel skipped (no trades executed)")
+        else:
+            self._overlord_sentinel_report(api_summary, out)
         
-        # Overlord Sentinel Report
+        if out:
+            sys.stdout.write('\n'.join(out) + '\n')
+            sys.stdout.flush()
+
+    def _overlord_sentinel_report(self, api_summary: dict, out: List[str]):
+        """Record baseline metrics, check risks and append the Overlord reports to `out`"""
         try:
-            self.baseline_collector.record_metric('api_first_score', api_score)
-            self.baseline_collector.record_metric('ui_fallbacks', ui_fallbacks)
-            self.baseline_collector.record_metric('demo_fallbacks', api_summary['demo_fallbacks'])
-            self.baseline_collector.record_metric('supabase_success_rate', api_summary['supabase_success_rate'])
-            
-            current_metrics = {
-                'api_first_score': api_score,
-                'ui_fallbacks': ui_fallbacks,
+            self.baseline_collector.record_metrics({
+                'api_first_score': api_summary['api_first_score'],
+                'ui_fallbacks': api_summary['ui_fallbacks'],
                 'demo_fallbacks': api_summary['demo_fallbacks'],
                 'supabase_success_rate': api_summary['supabase_success_rate']
-            }
-            self.risk_sentinel.check_risks(current_metrics)
+            })
+            
+            # check_risks() reads the keys it needs and ignores the rest
+            self.risk_sentinel.check_risks(api_summary)
             
             overlord_report_obj = OverlordReport(self.baseline_collector, self.risk_sentinel)
             
@@ -984,22 +2281,25 @@ class GrailAgent:
             else:
                 overlord_report = overlord_report_obj.generate()
             
-            print(overlord_report_obj.format_human_readable(overlord_report))
-            print(self.risk_sentinel.format_report())
+            out.append(overlord_report_obj.format_human_readable(overlord_report))
+            out.append(self.risk_sentinel.format_report())
             
-            self.baseline_collector.save_session()
-            overlord_report_obj.save_report(overlord_report)
+            # Written in the background; cleanup() waits for them
+            self._ckpt_pool.submit(self.baseline_collector.save_session)
+            self._ckpt_pool.submit(overlord_report_obj.save_report, overlord_report)
             
         except Exception as e:
-            self.logger.warning(f"Overlord Sentinel failed: {e}")
+            self.logger.warning("Overlord Sentinel failed: %s", e)
 
-        def _generate_supreme_report_v2(self):
+    def _generate_supreme_report_v2(self) -> Optional[str]:
         """
         Generate STEP 7 Supreme Report v2 (reporting only, read-only).
         MODIFIKACIYA 3 - Reporting-only integration.
+        
+        Returns the formatted report for print_summary() to emit, or None.
         """
         if not STEP7_AVAILABLE:
-            return
+            return None
         
         try:
             verifier = ExecutionVerifier()
@@ -1007,7 +2307,7 @@ class GrailAgent:
             
             if not verifications:
                 self.logger.debug("No STEP 7 verifications to report")
-                return
+                return None
             
             supreme_reporter = OverlordSupremeReportV2()
             report = supreme_reporter.generate_comprehensive_report(
@@ -1017,26 +2317,78 @@ class GrailAgent:
             )
             
             formatted = supreme_reporter.format_supreme_report(report)
-            print(formatted)
             self.logger.info("✓ Supreme Report v2 generated")
+            return formatted
             
         except Exception as e:
             self.logger.error(f"Supreme Report generation failed: {e}")
             # Graceful degradation: log error but don't break flow
+            return None
 
 
 
     def cleanup(self):
         """Cleanup resources"""
-        if self.browser:
+        if self._log_thread and self._log_thread.is_alive():
+            self._log_q.put(_LOG_STOP)
+            self._log_thread.join(timeout=10)
+        
+        self._db.close()
+        
+        self._io_pool.shutdown(wait=False)
+        # Checkpoint and Overlord files must land before the process exits
+        self._ckpt_pool.shutdown(wait=True)
+        
+        if self.http:
+            self.http.close()
+
+        # Playwright's sync API is bound to this thread, so it can't be closed
+        # elsewhere; a watchdog force-exits if the driver stops answering
+        if self._pw:
+            watchdog = threading.Timer(BROWSER_CLOSE_TIMEOUT_S, self._abort_browser_close)
+            watchdog.daemon = True
+            watchdog.start()
             try:
-                self.browser.close()
-                self.logger.info("Browser closed")
-            except:
-                pass
+                self.close_playwright()
+            finally:
+                watchdog.cancel()
+            self.logger.info("Browser closed")
+        # Drop the exit hook so it neither pins this agent nor closes unguarded
+        atexit.unregister(self.close_playwright)
 
+        self._release_log_listener()
+
+    def _abort_browser_close(self):
+        """Watchdog for cleanup(): the browser hung on close, exit without it"""
+        self.logger.error("Browser did not close within %.0fs, exiting", BROWSER_CLOSE_TIMEOUT_S)
+        _stop_log_listener()
+        os._exit(1)
+
+
+MODES = ('demo', 'live', 'smoke')
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """Parse CLI arguments; a lone ``--mode X`` skips argparse entirely"""
+    argv = sys.argv[1:] if argv is None else argv
+
+    # CI healthchecks run `--mode smoke` on every push, so keep that cheap
+    mode = None
+    if len(argv) == 2 and argv[0] == '--mode':
+        mode = argv[1]
+    elif len(argv) == 1 and argv[0].startswith('--mode='):
+        mode = argv[0][len('--mode='):]
+    if mode in MODES:
+        return SimpleNamespace(
+            mode=mode,
+            bankroll=1000.0,
+            num_predictions=20,
+            load_checkpoint=None,
+            fast_demo=False
+        )
+
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(
         description='Grail Agent - Autonomous Trading with Overlord Supreme (STEP 6)'
     )
@@ -1044,7 +2396,7 @@ def main():
         '--mode',
         type=str,
         default='demo',
-        choices=['demo', 'live', 'smoke'],
+        choices=MODES,
         help='Trading mode'
     )
     parser.add_argument(
@@ -1064,8 +2416,17 @@ def main():
         type=int,
         help='Load checkpoint (20, 50, 100, or 200)'
     )
+    parser.add_argument(
+        '--fast-demo',
+        action='store_true',
+        help='Demo mode: roll out the whole session at once (no pacing, no per-trade logging)'
+    )
     
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
     
     agent = GrailAgent(mode=args.mode, bankroll=args.bankroll)
     
@@ -1075,6 +2436,8 @@ def main():
         
         if args.mode == 'smoke':
             agent.run_smoke_test()
+        elif args.fast_demo and args.mode == 'demo':
+            agent.run_fast_demo(num_predictions=args.num_predictions)
         else:
             agent.run(num_predictions=args.num_predictions)
     
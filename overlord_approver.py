@@ -20,12 +20,15 @@ Restrictions:
 - Approval expires (TTL)
 """
 
+import os
 import json
 import hashlib
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
+
+from overlord_sentinel import write_atomic
 
 try:
     from overlord_metaplanner import ChangePlan, ChangePlanScope, ChangePlanRisk
@@ -34,6 +37,25 @@ except ImportError:
     ChangePlanScope = None
     ChangePlanRisk = None
 
+# Быстрый JSON (orjson) для файлов одобрений, иначе stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(obj: dict) -> bytes:
+    """Сериализовать в JSON (bytes, отступ 2)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _loads(data: bytes) -> dict:
+    """Разобрать JSON из bytes"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
 
 class ApprovedChangePlan:
     """
@@ -64,8 +86,9 @@ class ApprovedChangePlan:
         self.plan_id = plan.id
         self.plan = plan
         self.approved_by = approved_by
-        self.approved_at = datetime.now()
-        self.expires_at = datetime.now() + timedelta(hours=ttl_hours)
+        now = datetime.now()
+        self.approved_at = now
+        self.expires_at = now + timedelta(hours=ttl_hours)
         self.approval_reason = approval_reason
         
         # Checksum для проверки целостности
@@ -88,17 +111,22 @@ class ApprovedChangePlan:
                        f"{plan.affected_parameters}|{plan.created_at.isoformat()}"
         return hashlib.sha256(plan_content.encode()).hexdigest()
     
-    def is_valid(self) -> bool:
+    def is_valid(self, now: Optional[datetime] = None) -> bool:
         """
         Проверить валидность одобрения
         
+        Args:
+            now: Момент проверки (для пакетных проверок реестра)
+        
         Returns:
             True если одобрение активно и не истекло
         """
         if self.status != "approved":
             return False
         
-        if datetime.now() > self.expires_at:
+        if now is None:
+            now = datetime.now()
+        if now > self.expires_at:
             self.status = "expired"
             return False
         
@@ -212,8 +240,7 @@ class PlanApprover:
         # Сохранить запрос
         request_file = self.approval_dir / f"request_{plan.id}.json"
         try:
-            with open(request_file, 'w') as f:
-                json.dump(request, f, indent=2)
+            write_atomic(request_file, _dumps(request))
             
             self.logger.info(f"✓ Approval request created: {plan.id}")
             self.logger.info(f"   Plan: {plan.description}")
@@ -263,8 +290,8 @@ class PlanApprover:
             
             # Сохранить одобрение
             approval_file = self.approval_dir / f"approval_{plan.id}.json"
-            with open(approval_file, 'w') as f:
-                json.dump(approved.to_dict(), f, indent=2)
+            # Решение человека: fsync до сообщения об успехе
+            write_atomic(approval_file, _dumps(approved.to_dict()), durable=True)
             
             self.logger.info(f"✅ Plan APPROVED: {plan.id}")
             self.logger.info(f"   By: {approved_by}")
@@ -309,8 +336,7 @@ class PlanApprover:
         # Сохранить отклонение
         rejection_file = self.approval_dir / f"rejection_{plan.id}.json"
         try:
-            with open(rejection_file, 'w') as f:
-                json.dump(rejection, f, indent=2)
+            write_atomic(rejection_file, _dumps(rejection), durable=True)
             
             self.logger.info(f"❌ Plan REJECTED: {plan.id}")
             self.logger.info(f"   By: {rejected_by}")
@@ -340,6 +366,8 @@ class ApprovalRegistry:
         self.approval_dir = Path(approval_dir)
         self.approval_dir.mkdir(parents=True, exist_ok=True)
         self.approved_plans: List[ApprovedChangePlan] = []
+        # plan_id -> одобрения этого плана в порядке добавления
+        self._by_plan_id: Dict[str, List[ApprovedChangePlan]] = {}
         self.logger = logging.getLogger('ApprovalRegistry')
         
         # Загрузить существующие одобрения
@@ -350,12 +378,18 @@ class ApprovalRegistry:
         Загрузить существующие одобрения из файлов
         """
         try:
-            approval_files = self.approval_dir.glob("approval_*.json")
+            # Один проход по каталогу: is_file() берётся из d_type, без stat
+            with os.scandir(self.approval_dir) as entries:
+                approval_files = [
+                    entry.path for entry in entries
+                    if entry.name.startswith("approval_") and entry.name.endswith(".json")
+                    and entry.is_file(follow_symlinks=False)
+                ]
             
             for file in approval_files:
                 try:
-                    with open(file, 'r') as f:
-                        data = json.load(f)
+                    with open(file, 'rb') as f:
+                        data = _loads(f.read())
                     
                     # Проверить статус
                     if data['status'] in ['approved', 'applied']:
@@ -376,6 +410,7 @@ class ApprovalRegistry:
         Добавить одобренный план в реестр
         """
         self.approved_plans.append(approved_plan)
+        self._by_plan_id.setdefault(approved_plan.plan_id, []).append(approved_plan)
         self.logger.info(f"✓ Added to registry: {approved_plan.plan_id}")
     
     def get_valid_approvals(self) -> List[ApprovedChangePlan]:
@@ -386,9 +421,10 @@ class ApprovalRegistry:
             List of ApprovedChangePlan with status='approved' and not expired
         """
         valid = []
+        now = datetime.now()
         
         for approval in self.approved_plans:
-            if approval.is_valid():
+            if approval.is_valid(now):
                 # Дополнительная проверка целостности
                 if approval.verify_integrity():
                     valid.append(approval)
@@ -402,20 +438,32 @@ class ApprovalRegistry:
     def get_by_plan_id(self, plan_id: str) -> Optional[ApprovedChangePlan]:
         """
         Получить одобрение по ID плана
+        
+        Если план одобрялся несколько раз - самое раннее из оставшихся
         """
-        for approval in self.approved_plans:
-            if approval.plan_id == plan_id:
-                return approval
-        return None
+        approvals = self._by_plan_id.get(plan_id)
+        return approvals[0] if approvals else None
     
     def cleanup_expired(self):
         """
         Удалить истёкшие одобрения
         """
-        expired = [a for a in self.approved_plans if not a.is_valid() and a.status == "expired"]
+        # Один проход: applied/revoked остаются в реестре для аудита
+        now = datetime.now()
+        kept = []
+        removed = 0
         
-        for approval in expired:
+        for approval in self.approved_plans:
+            if approval.is_valid(now) or approval.status != "expired":
+                kept.append(approval)
+                continue
+            
             self.logger.info(f"⏰ Cleaning expired approval: {approval.plan_id}")
-            self.approved_plans.remove(approval)
+            approvals = self._by_plan_id[approval.plan_id]
+            approvals.remove(approval)
+            if not approvals:
+                del self._by_plan_id[approval.plan_id]
+            removed += 1
         
-        return len(expired)
+        self.approved_plans = kept
+        return removed
@@ -11,6 +11,7 @@ Mode: READ-ONLY + LEVEL 1 AUTONOMY
 - Control signals reporting
 """
 
+import os
 import json
 import logging
 import statistics
@@ -22,6 +23,80 @@ from enum import Enum
 if TYPE_CHECKING:
     from overlord_controller import OverlordController, ControlSignal
 
+# Optional C-accelerated JSON for reports (stdlib json fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_report(report: dict) -> bytes:
+    """Serialize a report to indented JSON bytes; unknown types fall back to str()"""
+    if ORJSON_AVAILABLE:
+        # Pass datetimes/dataclasses to default=str, as json.dump did
+        return orjson.dumps(
+            report,
+            default=str,
+            option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS)
+        )
+    return json.dumps(report, indent=2, default=str).encode('utf-8')
+
+
+def write_atomic(path: Path, data: bytes, durable: bool = False):
+    """
+    Write bytes via a staging file and rename it over `path`
+    
+    Readers see either the previous file or the complete new one. fsync
+    is only paid when `durable` is set (checkpoints, approvals); baseline
+    and report files can be regenerated. Shared by the Grail agent and
+    the Overlord modules.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# Static pieces of OverlordReport.format_human_readable(), built once;
+# the %-fields are left-justified to keep the box edge aligned
+_REPORT_BLANK = "║" + " " * 62 + "║\n"
+_REPORT_RULE = "╠" + "═" * 62 + "╣\n"
+_REPORT_HEADER = (
+    "\n"
+    + "╔" + "═" * 62 + "╗\n"
+    + "║" + " " * 15 + "OVERLORD SENTINEL REPORT" + " " * 23 + "║\n"
+    + _REPORT_RULE
+    + _REPORT_BLANK
+)
+_REPORT_BASELINE_COLLECTING = "║  Baseline: COLLECTING (need 3+ sessions)              ║\n"
+_REPORT_BASELINE = "║  Baseline: %-51s║\n║  API-first: %-42s║\n"
+_REPORT_RISKS = (
+    _REPORT_BLANK
+    + "║  Risk Signals: %-47s║\n"
+    + "║    🔴 High: %-49s║\n"
+    + "║    🟡 Medium: %-47s║\n"
+    + "║    🟢 Low: %-49s║\n"
+    + _REPORT_BLANK
+)
+_REPORT_CONTROL_HEADER = (
+    _REPORT_RULE
+    + "║" + " " * 15 + "CONTROL SIGNALS (LEVEL 1)" + " " * 22 + "║\n"
+    + _REPORT_RULE
+    + _REPORT_BLANK
+    + "║  Active Signals: %-44s║\n"
+)
+_REPORT_FORCE_DEMO = "║    🔴 Force Demo Mode: ACTIVE" + " " * 29 + "║\n"
+_REPORT_BLOCK_LIVE = "║    🔴 Block Live Mode: ACTIVE" + " " * 29 + "║\n"
+_REPORT_NO_UI_FALLBACK = "║    🟡 Disable UI Fallback: ACTIVE" + " " * 24 + "║\n"
+_REPORT_PREDICTION_LIMIT = "║    🟡 Prediction Limit: %-33s║\n"
+_REPORT_CI_EARLY_EXIT = "║    ⚠️  CI Early Exit: ACTIVE" + " " * 30 + "║\n"
+_REPORT_FOOTER = "╚" + "═" * 62 + "╝\n"
+
 
 class RiskAttractor(Enum):
     """Признаки деградации системы"""
@@ -73,6 +148,10 @@ class BaselineCollector:
         """Записать метрику текущей сессии"""
         self.current_session[metric_name] = value
     
+    def record_metrics(self, metrics: Dict):
+        """Записать несколько метрик текущей сессии (в памяти, до save_session)"""
+        self.current_session.update(metrics)
+    
     def save_session(self):
         """Сохранить сессию в baseline file"""
         try:
@@ -86,9 +165,8 @@ class BaselineCollector:
             # Добавить текущую сессию
             baseline['sessions'].append(self.current_session)
             
-            # Сохранить
-            with open(self.baseline_file, 'w') as f:
-                json.dump(baseline, f, indent=2)
+            # Сохранить одной записью: tmp-файл + атомарная замена
+            write_atomic(self.baseline_file, json.dumps(baseline, indent=2).encode('utf-8'))
             
             self.logger.info(f"✓ Baseline session saved ({len(baseline['sessions'])} total)")
             
@@ -343,72 +421,55 @@ class OverlordReport:
     
     def format_human_readable(self, report: dict) -> str:
         """Человекочитаемый формат"""
-        output = "\n"
-        output += "╔" + "═" * 62 + "╗\n"
-        output += "║" + " " * 15 + "OVERLORD SENTINEL REPORT" + " " * 23 + "║\n"
-        output += "╠" + "═" * 62 + "╣\n"
-        output += "║" + " " * 62 + "║\n"
+        lines = [_REPORT_HEADER]
         
         # Baseline status
         baseline = report['baseline']
         if baseline.get('status') == 'collecting':
-            output += "║  Baseline: COLLECTING (need 3+ sessions)              ║\n"
+            lines.append(_REPORT_BASELINE_COLLECTING)
         else:
-            sessions = baseline['total_sessions']
-            api_score = baseline['api_first_score']['mean']
-            output += f"║  Baseline: {sessions} sessions collected" + " " * (32 - len(str(sessions))) + "║\n"
-            output += f"║  API-first: {api_score:.1f}% (avg)" + " " * (35 - len(f"{api_score:.1f}")) + "║\n"
-        
-        output += "║" + " " * 62 + "║\n"
+            lines.append(_REPORT_BASELINE % (
+                "%s sessions collected" % baseline['total_sessions'],
+                "%.1f%% (avg)" % baseline['api_first_score']['mean']
+            ))
         
         # Risk signals
         assessment = report['risk_assessment']
-        total = assessment['total_signals']
-        output += f"║  Risk Signals: {total}" + " " * (47 - len(str(total))) + "║\n"
-        
         by_level = assessment['by_level']
-        output += f"║    🔴 High: {by_level['high']}" + " " * (49 - len(str(by_level['high']))) + "║\n"
-        output += f"║    🟡 Medium: {by_level['medium']}" + " " * (47 - len(str(by_level['medium']))) + "║\n"
-        output += f"║    🟢 Low: {by_level['low']}" + " " * (49 - len(str(by_level['low']))) + "║\n"
-        
-        output += "║" + " " * 62 + "║\n"
+        lines.append(_REPORT_RISKS % (
+            assessment['total_signals'], by_level['high'], by_level['medium'], by_level['low']
+        ))
         
         # Control signals (если есть)
         if 'control_signals' in report:
             cs = report['control_signals']
-            output += "╠" + "═" * 62 + "╣\n"
-            output += "║" + " " * 15 + "CONTROL SIGNALS (LEVEL 1)" + " " * 22 + "║\n"
-            output += "╠" + "═" * 62 + "╣\n"
-            output += "║" + " " * 62 + "║\n"
-            output += f"║  Active Signals: {cs['total_active']}" + " " * (44 - len(str(cs['total_active']))) + "║\n"
+            lines.append(_REPORT_CONTROL_HEADER % cs['total_active'])
             
             controls = cs['execution_controls']
             if controls['force_demo_mode']:
-                output += "║    🔴 Force Demo Mode: ACTIVE" + " " * 29 + "║\n"
+                lines.append(_REPORT_FORCE_DEMO)
             if controls['block_live_mode']:
-                output += "║    🔴 Block Live Mode: ACTIVE" + " " * 29 + "║\n"
+                lines.append(_REPORT_BLOCK_LIVE)
             if controls['disable_ui_fallback']:
-                output += "║    🟡 Disable UI Fallback: ACTIVE" + " " * 24 + "║\n"
+                lines.append(_REPORT_NO_UI_FALLBACK)
             if controls['max_predictions']:
-                output += f"║    🟡 Prediction Limit: {controls['max_predictions']}" + " " * (33 - len(str(controls['max_predictions']))) + "║\n"
+                lines.append(_REPORT_PREDICTION_LIMIT % controls['max_predictions'])
             if controls['ci_early_exit']:
-                output += "║    ⚠️  CI Early Exit: ACTIVE" + " " * 30 + "║\n"
+                lines.append(_REPORT_CI_EARLY_EXIT)
             
-            output += "║" + " " * 62 + "║\n"
+            lines.append(_REPORT_BLANK)
         
-        output += "╚" + "═" * 62 + "╝\n"
+        lines.append(_REPORT_FOOTER)
         
         # Recommendations
         if report.get('human_recommendations'):
-            output += "\nHUMAN RECOMMENDATIONS:\n"
-            for rec in report['human_recommendations']:
-                output += f"  {rec}\n"
+            lines.append("\nHUMAN RECOMMENDATIONS:\n")
+            lines.extend("  %s\n" % rec for rec in report['human_recommendations'])
         elif report.get('recommendations'):
-            output += "\nRECOMMENDATIONS:\n"
-            for rec in report['recommendations']:
-                output += f"  {rec}\n"
+            lines.append("\nRECOMMENDATIONS:\n")
+            lines.extend("  %s\n" % rec for rec in report['recommendations'])
         
-        return output
+        return ''.join(lines)
     
     def save_report(self, report: dict, report_dir: str = ".baseline"):
         """Сохранить отчёт в JSON"""
@@ -417,8 +478,7 @@ class OverlordReport:
             report_path.mkdir(exist_ok=True)
             
             report_file = report_path / f"report_{int(datetime.now().timestamp())}.json"
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            write_atomic(report_file, _dump_report(report))
             
             self.logger.info(f"✓ Overlord report saved: {report_file}")
         except Exception as e:
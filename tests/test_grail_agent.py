@@ -83,6 +83,726 @@ class TestGrailAgentProduction:
             mock_create_client.assert_called_once_with('https://test.supabase.co', 'test_key')
 
 
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    """Demo-mode GrailAgent isolated in a temporary working directory."""
+    from grail_agent_production import GrailAgent
+    
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('SUPABASE_URL', raising=False)
+    monkeypatch.delenv('SUPABASE_KEY', raising=False)
+    monkeypatch.setattr(GrailAgent, 'init_ml_model', lambda self: None)
+    agent = GrailAgent(mode="demo", bankroll=1000.0)
+    yield agent
+    agent.cleanup()
+
+
+class TestGrailAgent:
+    """Test suite for GrailAgent."""
+
+    def test_sentiment_batch_preserves_order(self, agent):
+        """Test batched sentiment returns one result per text, in order."""
+        texts = ["bullish profit ahead", "bearish loss risk", "flat market"]
+        results = agent.analyze_sentiment_batch(texts)
+        
+        assert [r['label'] for r in results] == ['POSITIVE', 'NEGATIVE', 'NEUTRAL']
+        assert agent.analyze_sentiment(texts[0]) == results[0]
+
+    def test_sentiment_batch_single_model_call(self, agent):
+        """Test the model is invoked once for the whole batch."""
+        calls = []
+        
+        def fake_model(texts, **kwargs):
+            calls.append(list(texts))
+            return [{'label': 'POSITIVE', 'score': 0.9} for _ in texts]
+        
+        agent.sentiment_analyzer = fake_model
+        results = agent.analyze_sentiment_batch(["a", "b", "c"])
+        
+        assert len(calls) == 1
+        assert len(results) == 3
+
+    def test_sentiment_cache_skips_repeat_texts(self, agent):
+        """Test repeated texts are served from the sentiment cache."""
+        calls = []
+        
+        def fake_model(texts, **kwargs):
+            calls.append(list(texts))
+            return [{'label': 'POSITIVE', 'score': 0.9} for _ in texts]
+        
+        agent.sentiment_analyzer = fake_model
+        agent.analyze_sentiment_batch(["a", "b", "a"])
+        results = agent.analyze_sentiment_batch(["b", "c"])
+        
+        assert calls == [["a", "b"], ["c"]]
+        assert len(results) == 2
+        assert agent.api_metrics.metrics['sentiment_cache_hits'] == 2
+        assert agent.api_metrics.metrics['sentiment_cache_misses'] == 3
+
+    def test_sentiment_cache_evicts_least_recent(self, agent, monkeypatch):
+        """Test the sentiment cache is bounded and keeps recently used texts."""
+        monkeypatch.setattr('grail_agent_production.SENTIMENT_CACHE_SIZE', 2)
+        agent.sentiment_analyzer = lambda texts, **kwargs: [
+            {'label': 'POSITIVE', 'score': 0.9} for _ in texts
+        ]
+        
+        agent.analyze_sentiment_batch(["a", "b"])
+        agent.analyze_sentiment_batch(["a"])
+        agent.analyze_sentiment_batch(["c"])
+        
+        assert list(agent._sentiment_cache) == ["a", "c"]
+
+    def test_supabase_rows_flushed_in_batches(self, agent):
+        """Test predictions are buffered and inserted in one request."""
+        agent.supabase = MagicMock()
+        agent._start_log_worker()
+        event = {'title': 'CLASSIC: BTC/USDT Movement'}
+        sentiment = {'label': 'POSITIVE', 'score': 0.9}
+        
+        for _ in range(3):
+            agent._log_prediction(event, sentiment, 0.8)
+        agent._log_q.join()
+        agent.supabase.table.assert_not_called()
+        
+        agent._flush_supabase()
+        agent.supabase.table.assert_called_once_with('predictions')
+        rows = agent.supabase.table.return_value.insert.call_args[0][0]
+        assert len(rows) == 3
+        assert agent.predictions_logged == 3
+
+    def test_supabase_rows_flushed_on_interval(self, agent):
+        """Test a partial batch is flushed once the flush interval elapses."""
+        import time
+        
+        agent.supabase = MagicMock()
+        agent._flush_interval = 0.05
+        agent._start_log_worker()
+        
+        agent._log_trade({'id': 'trade_1'})
+        deadline = time.monotonic() + 2
+        while agent._trade_buf or not agent.supabase.table.called:
+            assert time.monotonic() < deadline, "interval flush never happened"
+            time.sleep(0.01)
+        
+        agent.supabase.table.assert_called_once_with('trades')
+
+    def test_supabase_failed_flush_keeps_rows(self, agent):
+        """Test rows stay buffered when a batch insert fails."""
+        agent.supabase = MagicMock()
+        agent.supabase.table.return_value.insert.return_value.execute.side_effect = Exception("down")
+        agent._start_log_worker()
+        
+        agent._log_trade({'id': 'trade_1'})
+        agent._flush_supabase()
+        
+        assert agent._trade_buf == [{'id': 'trade_1'}]
+
+    def test_full_log_queue_drops_instead_of_blocking(self, agent):
+        """Test producers never block on a backed-up Supabase writer."""
+        import queue
+        
+        agent.supabase = MagicMock()
+        agent._log_q = queue.Queue(maxsize=1)
+        
+        agent._log_trade({'id': 'trade_1'})
+        agent._log_trade({'id': 'trade_2'})
+        
+        assert agent._log_q.qsize() == 1
+        assert agent.api_metrics.supabase_dropped == 1
+
+    def test_checkpoint_flush_request_never_blocks(self, agent):
+        """Test a non-waiting flush returns even when the writer queue is full."""
+        import queue
+        import threading
+        
+        agent._log_thread = MagicMock()
+        agent._log_thread.is_alive.return_value = True
+        agent._log_q = queue.Queue(maxsize=1)
+        agent._log_q.put_nowait(('trades', {'id': 'trade_1'}))
+        
+        caller = threading.Thread(target=agent._flush_supabase, kwargs={'wait': False})
+        caller.start()
+        caller.join(2)
+        agent._log_thread = None
+        
+        assert not caller.is_alive()
+        assert agent._log_q.qsize() == 1
+
+    def test_config_reload_rebinds_parameters(self, agent):
+        """Test cached parameter attributes follow config file changes."""
+        import json
+        
+        loader = agent.config_loader
+        assert loader.confidence_threshold == 0.70
+        
+        loader.config_file.write_text(json.dumps({'parameters': {'confidence_threshold': '0.85'}}))
+        loader.reload()
+        
+        assert loader.confidence_threshold == 0.85
+        assert loader.max_predictions == 20
+
+    def test_confidence_batch_matches_single(self, agent):
+        """Test batched confidence equals per-event confidence."""
+        agent.trades_executed, agent.wins, agent.consecutive_losses = 10, 8, 2
+        events = [
+            {'pattern': 'NEWSEVENT', 'odds': 2.0},
+            {'pattern': 'VOLEVENT', 'odds': 1.5},
+            {'odds': '2.1'},
+        ]
+        sentiments = [{'label': 'POSITIVE', 'score': 0.9}] * 3
+        
+        batch = agent.calculate_confidence_batch(events, sentiments)
+        
+        assert batch == [agent.calculate_confidence(e, s) for e, s in zip(events, sentiments)]
+        assert batch[0] == pytest.approx(min(0.9 * 1.2 * 1.05 * 1.1 * 0.8, 0.98))
+        assert batch[1] == pytest.approx(0.9 * 0.95 * 1.1 * 0.8)
+
+    def test_circuit_breaker_cooldown_does_not_sleep(self, agent):
+        """Test the circuit breaker blocks trades without blocking the caller."""
+        event = {'title': 'BTC rally', 'pattern': 'CLASSIC', 'odds': 2.0}
+        agent.consecutive_losses = agent.max_consecutive_losses
+        
+        with patch('time.sleep', side_effect=AssertionError("slept")):
+            agent._health_check()
+        
+        assert agent.circuit_breaker_triggered
+        assert agent.place_prediction(event, 0.9) == {'status': 'blocked', 'reason': 'cooldown'}
+        
+        agent._cb_until = 0.0
+        result = agent.place_prediction(event, 0.9)
+        
+        assert result['result'] in ('WIN', 'LOSS')
+        assert agent.trades_executed == 1
+
+    def test_checkpoint_roundtrip(self, agent):
+        """Test checkpoints are written atomically and restored."""
+        agent.trades_executed, agent.wins, agent.bankroll = 20, 15, 1137.5
+        agent.save_checkpoint(20)
+        agent._await_checkpoint_writes()
+        
+        assert (agent.checkpoint_dir / "checkpoint_20.json").exists()
+        assert not list(agent.checkpoint_dir.glob('*.tmp'))
+        
+        agent.trades_executed, agent.wins, agent.bankroll = 0, 0, 0.0
+        
+        assert agent.load_checkpoint(20)
+        assert (agent.trades_executed, agent.wins, agent.bankroll) == (20, 15, 1137.5)
+
+    def test_unchanged_checkpoint_not_rewritten(self, agent):
+        """Test saving the same checkpoint twice without state changes is skipped."""
+        agent.save_checkpoint(20)
+        agent._await_checkpoint_writes()
+        checkpoint_file = agent.checkpoint_dir / "checkpoint_20.json"
+        checkpoint_file.unlink()
+        
+        agent.save_checkpoint(20)
+        agent._await_checkpoint_writes()
+        assert not checkpoint_file.exists()
+        
+        agent.wins += 1
+        agent.save_checkpoint(20)
+        agent._await_checkpoint_writes()
+        assert checkpoint_file.exists()
+
+    def test_checkpoint_replays_trade_log(self, agent):
+        """Test trades journaled after a checkpoint are replayed on load."""
+        event = {'title': 'BTC rally', 'pattern': 'CLASSIC', 'odds': 2.0}
+        agent.place_prediction(event, 0.9)
+        agent.save_checkpoint(1)
+        agent.place_prediction(event, 0.9)
+        agent.place_prediction(event, 0.9)
+        expected = (agent.trades_executed, agent.wins, agent.losses, agent.bankroll)
+        
+        agent.trades_executed, agent.wins, agent.losses, agent.bankroll = 0, 0, 0, 0.0
+        
+        assert agent.load_checkpoint(1)
+        assert (agent.trades_executed, agent.wins, agent.losses, agent.bankroll) == expected
+
+    def test_journal_error_still_trips_circuit_breaker(self, agent):
+        """Test a failed trade journal write doesn't skip the health check."""
+        event = {'title': 'BTC rally', 'pattern': 'CLASSIC', 'odds': 2.0}
+        # Another process resuming the same session already journaled trade 1
+        agent._db.execute(
+            "INSERT INTO trades (id, session_id) VALUES (?, ?)",
+            (agent._trade_id_prefix + '1', agent.session_id)
+        )
+        agent.consecutive_losses = agent.max_consecutive_losses - 1
+        
+        result = agent.place_prediction(event, 0.5, random_draw=0.99)
+        
+        assert result['result'] == 'LOSS'
+        assert agent.bankroll == pytest.approx(980.0)
+        assert agent.circuit_breaker_triggered
+
+    def test_checkpoint_replay_ignores_other_sessions(self, agent):
+        """Test resuming a checkpoint replays only that session's trades."""
+        from grail_agent_production import GrailAgent
+        
+        event = {'title': 'BTC rally', 'pattern': 'CLASSIC', 'odds': 2.0}
+        other = GrailAgent(mode="demo", bankroll=500.0)
+        try:
+            agent.place_prediction(event, 0.9)
+            agent.save_checkpoint(1)
+            other.place_prediction(event, 0.9)
+            agent.place_prediction(event, 0.9)
+            other.place_prediction(event, 0.9)
+            expected = (agent.trades_executed, agent.wins, agent.losses, agent.bankroll)
+        finally:
+            other.cleanup()
+        
+        agent.trades_executed, agent.wins, agent.losses, agent.bankroll = 0, 0, 0, 0.0
+        
+        assert agent.load_checkpoint(1)
+        assert (agent.trades_executed, agent.wins, agent.losses, agent.bankroll) == expected
+
+    def test_checkpoints_are_kept_per_session(self, agent):
+        """Test two sessions saving the same checkpoint ID don't overwrite each other."""
+        from grail_agent_production import GrailAgent
+        
+        event = {'title': 'BTC rally', 'pattern': 'CLASSIC', 'odds': 2.0}
+        other = GrailAgent(mode="demo", bankroll=500.0)
+        try:
+            agent.place_prediction(event, 0.9)
+            agent.save_checkpoint(1)
+            other.place_prediction(event, 0.9)
+            other.place_prediction(event, 0.9)
+            other.save_checkpoint(1)
+            agent.place_prediction(event, 0.9)
+            expected = (agent.trades_executed, agent.wins, agent.losses, agent.bankroll)
+            other_state = (other.trades_executed, other.bankroll)
+        finally:
+            other.cleanup()
+        
+        agent.trades_executed, agent.wins, agent.losses, agent.bankroll = 0, 0, 0, 0.0
+        assert agent.load_checkpoint(1)
+        assert (agent.trades_executed, agent.wins, agent.losses, agent.bankroll) == expected
+        
+        # A fresh process resuming "checkpoint 1" gets the latest one saved
+        fresh = GrailAgent(mode="demo", bankroll=1000.0)
+        try:
+            assert fresh.load_checkpoint(1)
+            assert (fresh.trades_executed, fresh.bankroll) == other_state
+        finally:
+            fresh.cleanup()
+
+    def test_ml_model_warms_in_background(self, tmp_path, monkeypatch):
+        """Test the model loads off the constructor path and is awaited on first use."""
+        import threading
+        from grail_agent_production import GrailAgent
+        
+        release = threading.Event()
+        
+        def slow_init(self):
+            release.wait(5)
+            self.sentiment_analyzer = lambda texts, **kwargs: [
+                {'label': 'POSITIVE', 'score': 0.8} for _ in texts
+            ]
+        
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('SUPABASE_URL', raising=False)
+        monkeypatch.delenv('SUPABASE_KEY', raising=False)
+        monkeypatch.setattr(GrailAgent, 'init_ml_model', slow_init)
+        agent = GrailAgent(mode="demo", bankroll=1000.0)
+        
+        try:
+            assert agent.sentiment_analyzer is None
+            
+            release.set()
+            
+            assert agent.analyze_sentiment("BTC rally") == {'label': 'POSITIVE', 'score': 0.8}
+        finally:
+            release.set()
+            agent.cleanup()
+
+    def test_ml_warmup_timeout_is_waited_once(self, tmp_path, monkeypatch):
+        """Test a slow model load blocks one sentiment call, not every call."""
+        import threading
+        import time
+        import grail_agent_production
+        from grail_agent_production import GrailAgent
+        
+        release = threading.Event()
+        
+        def slow_init(self):
+            release.wait(5)
+            self.sentiment_analyzer = lambda texts, **kwargs: [
+                {'label': 'POSITIVE', 'score': 0.8} for _ in texts
+            ]
+        
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('SUPABASE_URL', raising=False)
+        monkeypatch.delenv('SUPABASE_KEY', raising=False)
+        monkeypatch.setattr(GrailAgent, 'init_ml_model', slow_init)
+        monkeypatch.setattr(grail_agent_production, 'ML_WARMUP_TIMEOUT_S', 0.2)
+        agent = GrailAgent(mode="demo", bankroll=1000.0)
+        try:
+            assert agent.analyze_sentiment("flat market")['label'] == 'NEUTRAL'
+            
+            start = time.monotonic()
+            assert agent.analyze_sentiment("flat market")['label'] == 'NEUTRAL'
+            assert time.monotonic() - start < 0.1
+            
+            release.set()
+            agent._ml_thread.join(5)
+            assert agent.analyze_sentiment("BTC rally") == {'label': 'POSITIVE', 'score': 0.8}
+        finally:
+            release.set()
+            agent.cleanup()
+
+    def test_demo_template_reused_until_expiry(self, agent):
+        """Test demo titles are reused within the TTL and refreshed after it."""
+        first = agent._generate_demo_events()
+        second = agent._generate_demo_events()
+        
+        assert [e['title'] for e in first] == [e['title'] for e in second]
+        assert first[0] is not second[0]
+        
+        agent._demo_template_expires = 0.0
+        agent._generate_demo_events()
+        
+        assert agent._demo_template_expires > 0.0
+
+    def test_place_prediction_uses_supplied_draw(self, agent):
+        """Test a pre-rolled draw decides the demo outcome."""
+        event = {'title': 'BTC rally', 'pattern': 'CLASSIC', 'odds': 2.0}
+        
+        assert agent.place_prediction(event, 0.9, random_draw=0.1)['result'] == 'WIN'
+        assert agent.place_prediction(event, 0.9, random_draw=0.95)['result'] == 'LOSS'
+
+    def test_grail_seed_makes_demo_reproducible(self, agent, monkeypatch):
+        """Test GRAIL_SEED fixes demo events and outcomes across agents."""
+        from grail_agent_production import GrailAgent
+        
+        monkeypatch.setenv('GRAIL_SEED', '42')
+        first = GrailAgent(mode="demo", bankroll=1000.0)
+        second = GrailAgent(mode="demo", bankroll=1000.0)
+        try:
+            drawn = [
+                [(e['title'], e['odds']) for e in agent._generate_demo_events()]
+                for agent in (first, second)
+            ]
+            assert drawn[0] == drawn[1]
+            assert first._rng.random() == second._rng.random()
+        finally:
+            first.cleanup()
+            second.cleanup()
+
+    def test_simulate_batch_compounds_without_side_effects(self, agent):
+        """Test batch simulation compounds the bankroll and leaves state alone."""
+        events = [{'odds': 2.0}, {'odds': '3.0'}, {'odds': 2.0}]
+        
+        profits = agent.simulate_batch(events, [1.0, 1.0, 0.0])
+        
+        assert profits == pytest.approx([20.0, 40.8, -21.216])
+        assert (agent.trades_executed, agent.bankroll) == (0, 1000.0)
+
+    def test_simulate_batch_honours_emergency_stop(self, agent):
+        """Test batch simulation stops once the bankroll drops below the threshold."""
+        agent.min_bankroll_threshold = 990.0
+        
+        profits = agent.simulate_batch([{'odds': 2.0}] * 3, [0.0, 0.0, 0.0])
+        
+        assert profits == pytest.approx([-20.0])
+
+    def test_simulate_batch_blocks_trade_after_breaker_trip(self, agent):
+        """Test a circuit-breaker trip blocks the next trade, as in run()."""
+        agent.max_consecutive_losses = 2
+        events = [{'odds': 2.0}] * 4
+        
+        profits = agent.simulate_batch(events, [0.0, 0.0, 1.0, 1.0])
+        
+        assert profits == pytest.approx([-20.0, -19.6, 19.208])
+
+    def test_playwright_failed_launch_stops_driver(self, agent):
+        """Test a failed browser launch doesn't leak the Playwright driver."""
+        driver = MagicMock()
+        driver.chromium.launch.side_effect = Exception("no chromium")
+        
+        with patch('playwright.sync_api.sync_playwright') as sync_playwright:
+            sync_playwright.return_value.start.return_value = driver
+            assert agent.init_playwright() == (None, None)
+        
+        driver.stop.assert_called_once()
+        assert agent._pw is None
+        agent.close_playwright()
+
+    def test_browser_exit_hook_lives_with_the_driver(self, agent, monkeypatch):
+        """Test the atexit close hook is only held while a driver is running."""
+        import grail_agent_production
+
+        hooks = Mock()
+        monkeypatch.setattr(grail_agent_production, 'atexit', hooks)
+
+        with patch('playwright.sync_api.sync_playwright') as sync_playwright:
+            agent.init_playwright()
+
+        hooks.register.assert_called_once_with(agent.close_playwright)
+        hooks.unregister.reset_mock()
+
+        agent.cleanup()
+
+        hooks.unregister.assert_called_once_with(agent.close_playwright)
+
+    def test_closed_page_is_replaced_without_relaunch(self, agent):
+        """Test a dead page is recycled from the live browser context."""
+        agent.browser = MagicMock()
+        agent.browser.is_connected.return_value = True
+        agent.context = MagicMock()
+        agent.page = MagicMock()
+        agent.page.is_closed.return_value = True
+        
+        with patch.object(agent, 'init_playwright') as init_playwright:
+            page = agent._ensure_page()
+        
+        assert page is agent.context.new_page.return_value
+        init_playwright.assert_not_called()
+        agent.browser = agent.context = agent.page = None
+
+    def test_cleanup_force_exits_when_browser_close_hangs(self, agent, monkeypatch):
+        """Test cleanup() doesn't block forever on a wedged Playwright driver."""
+        import threading
+        import grail_agent_production
+        
+        exited = threading.Event()
+        monkeypatch.setattr(grail_agent_production, 'BROWSER_CLOSE_TIMEOUT_S', 0.05)
+        monkeypatch.setattr(grail_agent_production.os, '_exit', lambda code: exited.set())
+        agent._pw = MagicMock()
+        agent._pw.stop.side_effect = lambda: exited.wait(2)
+        
+        agent.cleanup()
+        
+        assert exited.is_set()
+
+    def test_slow_api_probe_warms_browser_meanwhile(self, agent, monkeypatch):
+        """Test the browser starts while a slow API probe is still running."""
+        import time
+        
+        events = [{'title': 'BTC rally', 'source': 'api'}]
+        
+        def slow_api():
+            time.sleep(0.2)
+            return events
+        
+        monkeypatch.setattr('grail_agent_production.API_GRACE_S', 0.01)
+        agent.mode = "live"
+        agent._scrape_via_api = slow_api
+        agent.init_playwright = Mock(return_value=(None, MagicMock()))
+        
+        assert agent.scrape_walbi_events() == events
+        agent.init_playwright.assert_called_once()
+
+    def test_fast_demo_totals_are_consistent(self, agent):
+        """Test the fast demo rollout applies coherent session totals."""
+        agent.sentiment_analyzer = lambda texts, **kwargs: [
+            {'label': 'POSITIVE', 'score': 0.9} for _ in texts
+        ]
+        
+        agent.run_fast_demo(num_predictions=50)
+        
+        assert agent.trades_executed == agent.wins + agent.losses > 0
+        assert agent.bankroll == pytest.approx(1000.0 + agent.total_profit)
+
+    def test_run_rescores_confidence_within_a_batch(self, agent, monkeypatch):
+        """Test losses earlier in a scraped batch lower the next trade's confidence."""
+        import grail_agent_production
+        
+        monkeypatch.setattr(grail_agent_production, 'PREDICTION_INTERVAL_S', 0.0)
+        agent.sentiment_analyzer = lambda texts, **kwargs: [
+            {'label': 'POSITIVE', 'score': 0.9} for _ in texts
+        ]
+        events = [
+            {'title': f'BTC rally {i}', 'pattern': 'NEWSEVENT', 'odds': 2.0}
+            for i in range(3)
+        ]
+        agent.scrape_walbi_events = Mock(return_value=events)
+        agent._rng = Mock(random=Mock(return_value=0.999))
+        agent.execution_guard = None
+        agent.overlord_controller = None
+        confidences = []
+        place_prediction = agent.place_prediction
+        
+        def record(event, confidence, *args, **kwargs):
+            confidences.append(confidence)
+            return place_prediction(event, confidence, *args, **kwargs)
+        
+        agent.place_prediction = record
+        agent.run(num_predictions=3)
+        
+        agent.scrape_walbi_events.assert_called_once()
+        assert agent.losses == 3
+        assert confidences[2] < confidences[0]
+
+    def test_fast_demo_respects_halt_and_execution_guard(self, agent):
+        """Test the fast demo applies run()'s emergency stop and Overlord limits."""
+        agent.sentiment_analyzer = lambda texts, **kwargs: [
+            {'label': 'POSITIVE', 'score': 0.9} for _ in texts
+        ]
+        agent.emergency_stop = True
+        agent.run_fast_demo(num_predictions=50)
+        assert agent.trades_executed == 0
+        
+        agent.emergency_stop = False
+        agent.execution_guard = Mock()
+        agent.execution_guard.should_exit_ci.return_value = (True, 'budget')
+        agent.run_fast_demo(num_predictions=50)
+        assert agent.trades_executed == 0
+        
+        agent.execution_guard.should_exit_ci.return_value = (False, None)
+        agent.execution_guard.get_prediction_limit.return_value = 5
+        agent.run_fast_demo(num_predictions=50)
+        assert 0 < agent.trades_executed <= 5
+
+    def test_rollout_carries_the_loss_streak(self, agent):
+        """Test the rollout starts from and writes back the agent's loss streak."""
+        agent.consecutive_losses = agent.max_consecutive_losses - 1
+        
+        # The first loss completes the streak and trips the breaker
+        assert agent.simulate_batch([{'odds': 2.0}] * 2, [0.0, 1.0]) == pytest.approx([-20.0])
+        
+        agent.sentiment_analyzer = lambda texts, **kwargs: [
+            {'label': 'POSITIVE', 'score': 0.9} for _ in texts
+        ]
+        agent._rng.random = lambda: 0.999
+        agent.run_fast_demo(num_predictions=5)
+        
+        assert agent.consecutive_losses == agent.max_consecutive_losses - 1 + agent.losses
+
+    def test_rank_events_orders_by_confidence(self, agent):
+        """Test a scraped batch is scored once and ranked best first."""
+        agent.sentiment_analyzer = lambda texts, **kwargs: [
+            {'label': 'POSITIVE', 'score': 0.9} for _ in texts
+        ]
+        events = [
+            {'title': 'a', 'pattern': 'VOLEVENT', 'odds': 1.5},
+            {'title': 'b', 'pattern': 'NEWSEVENT', 'odds': 1.5},
+            {'title': 'c', 'pattern': 'CLASSIC', 'odds': 1.5},
+        ]
+        
+        ranked = agent._rank_events(events)
+        
+        assert [event['title'] for event, _, _ in ranked] == ['b', 'c', 'a']
+        assert ranked[0][2] >= ranked[1][2] >= ranked[2][2]
+
+    def test_static_html_event_parsing(self, agent):
+        """Test server-rendered event cards are parsed without a browser."""
+        html = """
+        <div class="event-card">
+          <h3 class="event-title">BTC <b>rally</b></h3><br>
+          <p class="event-description">Will BTC close higher?</p>
+          <span class="event-odds">1.9</span>
+          <span class="event-deadline">2026-01-01</span>
+        </div>
+        <div class="event-card"><h3 class="event-title">Incomplete</h3></div>
+        """
+        response = MagicMock(status_code=200, text=html)
+        
+        with patch.object(agent.http, 'get', return_value=response):
+            events = agent._scrape_via_http('https://walbi.test/events')
+        
+        assert len(events) == 1
+        assert events[0]['title'] == 'BTC rally'
+        assert events[0]['odds'] == '1.9'
+        assert events[0]['source'] == 'http'
+
+    def test_static_html_parsing_tolerates_loose_markup(self):
+        """Test optional end tags and stray end tags don't merge or drop cards."""
+        from grail_agent_production import _EventCardParser
+        
+        html = """
+        <div class="event-card">
+          <h3 class="event-title">ETH</h3>
+          <p class="event-description">Unclosed paragraph
+          <p>Fine print</p>
+          <span class="event-odds">2.1</span>
+          <span class="event-deadline">2026-02-01</span>
+        </div></div></span>
+        <ul>
+          <li class="event-card"><b class="event-title">SOL</b>
+            <i class="event-description">Up?</i><i class="event-odds">1.5</i>
+            <i class="event-deadline">2026-03-01</i>
+          <li class="event-card"><b class="event-title">AAPL</b>
+            <i class="event-description">Down?</i><i class="event-odds">1.7</i>
+            <i class="event-deadline">2026-04-01</i>
+        </ul>
+        """
+        parser = _EventCardParser()
+        parser.feed(html)
+        parser.close()
+        
+        assert [card['title'] for card in parser.cards] == ['ETH', 'SOL', 'AAPL']
+        assert parser.cards[0]['description'] == 'Unclosed paragraph'
+        assert parser.cards[0]['odds'] == '2.1'
+        assert parser.cards[2]['deadline'] == '2026-04-01'
+
+    def test_summary_printed_when_info_logging_is_off(self, agent, capsys):
+        """Test the session summary reaches stdout regardless of the log level."""
+        import logging
+        
+        level = agent.logger.level
+        agent.logger.setLevel(logging.WARNING)
+        try:
+            agent.print_summary()
+        finally:
+            agent.logger.setLevel(level)
+        
+        assert "GRAIL AGENT SESSION SUMMARY" in capsys.readouterr().out
+
+    def test_smoke_check_outcomes(self, agent):
+        """Test smoke checks map to passed / skipped / failed statuses."""
+        def broken():
+            raise RuntimeError("boom")
+        
+        assert agent._run_smoke_check("Demo Events", agent._smoke_demo_events, 4, 6) is True
+        assert agent._run_smoke_check("Supabase", agent._smoke_supabase, 3, 6) is None
+        assert agent._run_smoke_check("Broken", broken, 1, 1) is False
+
+    def test_smoke_rng_checks_run_one_after_the_other(self, agent, monkeypatch):
+        """Test smoke checks drawing from the seeded RNG never run concurrently."""
+        import logging
+        import threading
+        import time
+        import grail_agent_production
+
+        generate = agent._generate_demo_events
+        lock = threading.Lock()
+        running = []
+        overlaps = []
+
+        def recording_generate():
+            with lock:
+                overlaps.append(len(running))
+                running.append(threading.current_thread().name)
+            time.sleep(0.05)
+            try:
+                return generate()
+            finally:
+                with lock:
+                    running.pop()
+
+        def stop(code):
+            raise SystemExit(code)
+
+        monkeypatch.setattr(agent, '_generate_demo_events', recording_generate)
+        monkeypatch.setattr(grail_agent_production.os, '_exit', stop)
+        monkeypatch.setattr(logging, 'shutdown', lambda: None)
+
+        with pytest.raises(SystemExit):
+            agent.run_smoke_test()
+
+        assert overlaps == [0, 0]
+
+    def test_parse_args_fast_path_matches_argparse(self):
+        """A lone --mode skips argparse but yields the same defaults"""
+        from grail_agent_production import parse_args
+        
+        fast = parse_args(['--mode', 'smoke'])
+        full = parse_args(['--mode', 'smoke', '--bankroll', '1000'])
+        
+        assert vars(fast) == vars(full)
+        assert parse_args(['--mode=live']).mode == 'live'
+        assert parse_args(['--mode', 'demo', '--fast-demo']).fast_demo is True
+
+
 def test_placeholder():
     """Placeholder test to ensure pytest can run."""
     assert 1 + 1 == 2